@@ -10,10 +10,14 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Above this many recent folders, existence checks run on a small thread pool
+RECENT_FOLDER_PARALLEL_THRESHOLD = 8
 
-@dataclass
+
+@dataclass(slots=True)
 class NormalizationRulesConfig:
     """Configuration for Vietnamese text normalization rules"""
     remove_diacritics: bool = True
@@ -93,7 +97,7 @@ class NormalizationRulesConfig:
         return is_valid, errors, warnings
 
 
-@dataclass
+@dataclass(slots=True)
 class UIPreferences:
     """UI preferences and window state configuration"""
     window_width: int = 600
@@ -177,7 +181,7 @@ class UIPreferences:
         return is_valid, errors, warnings
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationSettings:
     """Settings for file operation behavior"""
     dry_run_by_default: bool = True
@@ -255,7 +259,7 @@ class OperationSettings:
         return is_valid, errors, warnings
 
 
-@dataclass
+@dataclass(slots=True)
 class RecentFolder:
     """Recent folder entry với timestamp and usage tracking"""
     path: str
@@ -288,7 +292,7 @@ class RecentFolder:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfiguration:
     """Complete application configuration"""
     normalization_rules: NormalizationRulesConfig = field(default_factory=NormalizationRulesConfig)
@@ -405,9 +409,18 @@ class AppConfiguration:
     def clean_recent_folders(self) -> int:
         """Remove non-existent folders từ recent list"""
         initial_count = len(self.recent_folders)
+        paths = [folder.path for folder in self.recent_folders]
+        
+        # Stat calls release the GIL - overlap them when the list is long (slow network drives)
+        if len(paths) > RECENT_FOLDER_PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=RECENT_FOLDER_PARALLEL_THRESHOLD) as executor:
+                exists = list(executor.map(os.path.exists, paths))
+        else:
+            exists = [os.path.exists(path) for path in paths]
+        
         self.recent_folders = [
-            folder for folder in self.recent_folders
-            if os.path.exists(folder.path)
+            folder for folder, keep in zip(self.recent_folders, exists)
+            if keep
         ]
         removed_count = initial_count - len(self.recent_folders)
         
@@ -3,7 +3,8 @@ File information data models for Vietnamese text processing
 """
 
 import os
-from dataclasses import dataclass, field
+import stat
+from dataclasses import dataclass, field, InitVar
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
@@ -25,7 +26,7 @@ class OperationStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """
     Comprehensive file information model
@@ -55,19 +56,25 @@ class FileInfo:
     extension: str = ""
     name_without_extension: str = ""
     
-    def __post_init__(self):
+    # Already-fetched os.stat() result; init-only, lets from_path skip repeat stat calls
+    stat_info: InitVar[Optional[os.stat_result]] = None
+    
+    def __post_init__(self, stat_info: Optional[os.stat_result]):
         """Initialize computed fields after object creation"""
-        if self.path and os.path.exists(self.path):
+        if stat_info is not None:
+            self._populate_file_metadata(stat_info)
+        elif self.path and os.path.exists(self.path):
             self._populate_file_metadata()
         
         # Extract extension and name without extension
         if self.name:
             self.name_without_extension, self.extension = os.path.splitext(self.name)
     
-    def _populate_file_metadata(self):
+    def _populate_file_metadata(self, stat_info: Optional[os.stat_result] = None):
         """Populate file system metadata"""
         try:
-            stat_info = os.stat(self.path)
+            if stat_info is None:
+                stat_info = os.stat(self.path)
             self.size = stat_info.st_size
             self.modified_time = datetime.fromtimestamp(stat_info.st_mtime)
             self.created_time = datetime.fromtimestamp(stat_info.st_ctime)
@@ -94,27 +101,35 @@ class FileInfo:
         return f"{size:.1f} PB"
     
     @classmethod
-    def from_path(cls, file_path: str) -> 'FileInfo':
+    def from_path(cls, file_path: str,
+                  stat_cache: Optional[Dict[str, os.stat_result]] = None) -> 'FileInfo':
         """
         Create FileInfo from file path
         
         Args:
             file_path: Absolute path to file or directory
+            stat_cache: Optional path -> os.stat() result mapping (e.g. filled from
+                os.scandir entries); a hit replaces the stat syscall
             
         Returns:
             FileInfo object with populated metadata
         """
-        if not os.path.exists(file_path):
-            raise ValueError(f"Path does not exist: {file_path}")
+        stat_info = stat_cache.get(file_path) if stat_cache else None
+        if stat_info is None:
+            try:
+                stat_info = os.stat(file_path)
+            except OSError:
+                raise ValueError(f"Path does not exist: {file_path}")
             
         name = os.path.basename(file_path)
-        is_file = os.path.isfile(file_path)
+        is_file = stat.S_ISREG(stat_info.st_mode)
         
         return cls(
             name=name,
             original_name=name,
             path=os.path.abspath(file_path),
-            file_type=FileType.FILE if is_file else FileType.FOLDER
+            file_type=FileType.FILE if is_file else FileType.FOLDER,
+            stat_info=stat_info
         )
     
     def update_name(self, new_name: str):
@@ -36,13 +36,15 @@ class ConfigRepository:
         'last_updated': 'string'
     }
     
-    def __init__(self, db_service: Optional[DatabaseService] = None, db_path: Optional[str] = None):
+    def __init__(self, db_service: Optional[DatabaseService] = None, db_path: Optional[str] = None,
+                 testing_mode: bool = False):
         """
         Initialize config repository
         
         Args:
             db_service: Optional database service instance
             db_path: Optional custom database path
+            testing_mode: Relax SQLite durability (ignored when db_service is given)
         """
         if db_service:
             self.db_service = db_service
@@ -50,7 +52,7 @@ class ConfigRepository:
             # Create dedicated config database if not provided
             if db_path is None:
                 db_path = str(get_default_config_path())
-            self.db_service = DatabaseService(db_path)
+            self.db_service = DatabaseService(db_path, testing_mode=testing_mode)
         
         self._initialize_config_schema()
     
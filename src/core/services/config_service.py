@@ -5,8 +5,9 @@ High-level service for managing application configuration including
 user preferences, settings persistence, and real-time configuration updates.
 """
 
+import copy
 import logging
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Iterable
 from threading import Lock
 from datetime import datetime
 
@@ -25,15 +26,17 @@ class ConfigService:
     loading, saving, real-time updates, and change notifications.
     """
     
-    def __init__(self, db_service: Optional[DatabaseService] = None, db_path: Optional[str] = None):
+    def __init__(self, db_service: Optional[DatabaseService] = None, db_path: Optional[str] = None,
+                 testing_mode: bool = False):
         """
         Initialize configuration service
         
         Args:
             db_service: Optional database service instance
             db_path: Optional custom database path
+            testing_mode: Relax SQLite durability for throwaway test databases
         """
-        self.repository = ConfigRepository(db_service, db_path)
+        self.repository = ConfigRepository(db_service, db_path, testing_mode)
         self._current_config: Optional[AppConfiguration] = None
         self._change_listeners: List[Callable[[AppConfiguration], None]] = []
         self._lock = Lock()
@@ -51,17 +54,25 @@ class ConfigService:
             logger.error(f"Failed to load configuration: {e}")
             self._current_config = AppConfiguration()
     
+    def _cached_config(self) -> AppConfiguration:
+        """Live cached configuration - internal read-only use"""
+        if self._current_config is None:
+            self._load_configuration()
+        return self._current_config
+    
     def get_current_config(self) -> AppConfiguration:
         """
         Get current configuration
         
+        Served from the in-memory cache; the caller gets its own copy, so
+        changes only take effect through update_configuration().
+        
         Returns:
-            Current AppConfiguration instance
+            Copy of the current AppConfiguration
         """
+        config = self._cached_config()
         with self._lock:
-            if self._current_config is None:
-                self._load_configuration()
-            return self._current_config
+            return copy.deepcopy(config)
     
     def update_configuration(self, config: AppConfiguration, notify_listeners: bool = True) -> bool:
         """
@@ -89,10 +100,9 @@ class ConfigService:
                 logger.error("Failed to save configuration to repository")
                 return False
             
-            # Update current configuration
+            # Update current configuration - cache a copy the caller cannot mutate
             with self._lock:
-                old_config = self._current_config
-                self._current_config = config
+                self._current_config = copy.deepcopy(config)
             
             # Notify listeners
             if notify_listeners:
@@ -112,7 +122,9 @@ class ConfigService:
         Returns:
             NormalizationRulesConfig instance
         """
-        return self.get_current_config().normalization_rules
+        config = self._cached_config()
+        with self._lock:
+            return copy.deepcopy(config.normalization_rules)
     
     def update_normalization_rules(self, rules: NormalizationRulesConfig) -> bool:
         """
@@ -149,7 +161,9 @@ class ConfigService:
         Returns:
             UIPreferences instance
         """
-        return self.get_current_config().ui_preferences
+        config = self._cached_config()
+        with self._lock:
+            return copy.deepcopy(config.ui_preferences)
     
     def update_ui_preferences(self, preferences: UIPreferences) -> bool:
         """
@@ -186,7 +200,9 @@ class ConfigService:
         Returns:
             OperationSettings instance
         """
-        return self.get_current_config().operation_settings
+        config = self._cached_config()
+        with self._lock:
+            return copy.deepcopy(config.operation_settings)
     
     def update_operation_settings(self, settings: OperationSettings) -> bool:
         """
@@ -236,6 +252,30 @@ class ConfigService:
             logger.error(f"Failed to add recent folder: {e}")
             return False
     
+    def add_recent_folders_batch(self, folder_paths: Iterable[str]) -> bool:
+        """
+        Add several folders to recent folders list với one save
+        
+        Folders are added in order, so the last path ends up most recent.
+        Listeners are notified once for the whole batch.
+        
+        Args:
+            folder_paths: Paths to folders to add
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            config = self.get_current_config()
+            for folder_path in folder_paths:
+                config.add_recent_folder(folder_path)
+            
+            return self.update_configuration(config)
+            
+        except Exception as e:
+            logger.error(f"Failed to add recent folders: {e}")
+            return False
+    
     def get_recent_folders(self) -> List[str]:
         """
         Get list of recent folder paths
@@ -243,7 +283,7 @@ class ConfigService:
         Returns:
             List of recent folder paths
         """
-        return self.get_current_config().get_recent_folders_list()
+        return self._cached_config().get_recent_folders_list()
     
     def clean_recent_folders(self) -> int:
         """
@@ -299,6 +339,11 @@ class ConfigService:
             logger.error(f"Failed to reset to defaults: {e}")
             return False
     
+    def _set_in_memory_default(self):
+        """Swap the cached configuration for defaults without touching the database (tests)"""
+        with self._lock:
+            self._current_config = AppConfiguration()
+    
     def export_configuration(self) -> str:
         """
         Export configuration as JSON string
@@ -373,7 +418,12 @@ class ConfigService:
             config.ui_preferences.window_maximized = maximized
             
             # Save without notifying listeners (to avoid recursion)
-            return self.repository.save_configuration(config)
+            if not self.repository.save_configuration(config):
+                return False
+            
+            with self._lock:
+                self._current_config = config
+            return True
             
         except Exception as e:
             logger.error(f"Failed to update window geometry: {e}")
@@ -422,7 +472,7 @@ class ConfigService:
             Service information dictionary
         """
         try:
-            config = self.get_current_config()
+            config = self._cached_config()
             repo_info = self.repository.get_configuration_info()
             
             return {
@@ -445,7 +495,7 @@ class ConfigService:
             Validation results dictionary
         """
         try:
-            config = self.get_current_config()
+            config = self._cached_config()
             is_valid, errors, warnings = config.validate()
             
             return {
@@ -33,7 +33,14 @@ class DatabaseService:
     # Database schema version for migrations
     SCHEMA_VERSION = 2
     
-    def __init__(self, db_path: Optional[str] = None):
+    # Relaxed durability for throwaway test databases - no fsync per commit
+    TESTING_PRAGMAS = (
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA mmap_size = 268435456",
+    )
+    
+    def __init__(self, db_path: Optional[str] = None, testing_mode: bool = False):
         if db_path is None:
             # Default to app data directory
             app_data_dir = os.path.expanduser("~/.file_rename_tool")
@@ -41,6 +48,7 @@ class DatabaseService:
             db_path = os.path.join(app_data_dir, "operations.db")
             
         self.db_path = db_path
+        self.testing_mode = testing_mode
         self._local_storage = threading.local()
         self._lock = threading.Lock()
         
@@ -53,11 +61,15 @@ class DatabaseService:
             conn = sqlite3.connect(
                 self.db_path,
                 check_same_thread=False,
-                timeout=30.0
+                timeout=30.0,
+                uri=self.db_path.startswith("file:")  # e.g. shared-cache in-memory databases
             )
             conn.row_factory = sqlite3.Row  # Enable column name access
             conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
             conn.execute("PRAGMA journal_mode = WAL")  # Enable WAL mode for better concurrency
+            if self.testing_mode:
+                for pragma in self.TESTING_PRAGMAS:
+                    conn.execute(pragma)
             self._local_storage.connection = conn
             
         return self._local_storage.connection
@@ -11,7 +11,7 @@ Provides comprehensive file processing capabilities including:
 """
 
 import os
-from typing import List, Optional, Dict, Any, Generator, Callable
+from typing import List, Optional, Dict, Any, Generator, Callable, Set
 from pathlib import Path
 import logging
 
@@ -34,7 +34,8 @@ class FileOperationsEngine:
         self._current_operation_cancelled = False
     
     def scan_folder_contents(self, folder_path: str, recursive: bool = False, 
-                           include_hidden: bool = False) -> List[FileInfo]:
+                           include_hidden: bool = False,
+                           file_types: Optional[Set[FileType]] = None) -> List[FileInfo]:
         """
         Scan folder and return comprehensive file information
         
@@ -42,6 +43,7 @@ class FileOperationsEngine:
             folder_path: Path to scan
             recursive: Include subdirectories
             include_hidden: Include hidden files
+            file_types: Only return items of these types (all types if None)
             
         Returns:
             List of FileInfo objects
@@ -60,13 +62,15 @@ class FileOperationsEngine:
             raise PermissionError(f"Cannot read folder: {folder_path}")
         
         files_info = []
+        include_folders = file_types is None or FileType.FOLDER in file_types
+        include_files = file_types is None or FileType.FILE in file_types
         
         try:
             if recursive:
                 # Use os.walk for recursive scanning
                 for root, dirs, files in os.walk(folder_path):
                     # Process directories
-                    for dir_name in dirs:
+                    for dir_name in (dirs if include_folders else ()):
                         dir_path = os.path.join(root, dir_name)
                         if self._should_include_file(dir_name, include_hidden):
                             try:
@@ -76,7 +80,7 @@ class FileOperationsEngine:
                                 logger.warning(f"Skipping directory {dir_path}: {e}")
                     
                     # Process files
-                    for file_name in files:
+                    for file_name in (files if include_files else ()):
                         file_path = os.path.join(root, file_name)
                         if self._should_include_file(file_name, include_hidden):
                             try:
@@ -86,12 +90,14 @@ class FileOperationsEngine:
                                 logger.warning(f"Skipping file {file_path}: {e}")
             else:
                 # Single level scanning
-                items = os.listdir(folder_path)
-                items.sort()  # Consistent ordering
+                with os.scandir(folder_path) as it:
+                    entries = sorted(it, key=lambda e: e.name)  # Consistent ordering
                 
-                for item in items:
-                    item_path = os.path.join(folder_path, item)
-                    if self._should_include_file(item, include_hidden):
+                for entry in entries:
+                    item_path = entry.path
+                    if not (include_files if entry.is_file() else include_folders):
+                        continue
+                    if self._should_include_file(entry.name, include_hidden):
                         try:
                             file_info = FileInfo.from_path(item_path)
                             files_info.append(file_info)
@@ -351,6 +357,10 @@ class FileOperationsEngine:
         """Get history of batch operations"""
         return self._operation_history.copy()
     
+    def clear_history(self):
+        """Forget all recorded batch operations"""
+        self._operation_history.clear()
+    
     def cancel_current_operation(self):
         """Cancel the currently running batch operation"""
         self._current_operation_cancelled = True
@@ -14,7 +14,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 from pathlib import Path
 
-from ..models.file_info import FileInfo
+from ..models.file_info import FileInfo, FileType
 from ..utils.performance_monitor import PerformanceMonitor, PerformanceMetrics
 
 logger = logging.getLogger(__name__)
@@ -24,6 +24,7 @@ logger = logging.getLogger(__name__)
 class StreamingConfig:
     """Configuration for file streaming operations"""
     chunk_size: int = 1000
+    initial_chunk_size: int = 100  # First chunk size; doubles per chunk up to chunk_size
     max_concurrent_scans: int = 4
     memory_threshold_mb: int = 512  # Stop streaming if memory usage exceeds this
     scan_timeout_seconds: int = 30
@@ -154,6 +155,8 @@ class FileStreamingService:
         """Internal method to stream files from directory"""
         
         chunk = []
+        # Adaptive window: a small first chunk reaches the UI quickly, later ones grow
+        chunk_target = min(self.config.initial_chunk_size, self.config.chunk_size)
         loop = asyncio.get_event_loop()
         
         try:
@@ -174,14 +177,17 @@ class FileStreamingService:
                 progress.files_scanned += 1
                 
                 # Yield chunk when size reached
-                if len(chunk) >= self.config.chunk_size:
+                if len(chunk) >= chunk_target:
                     if chunk_callback:
                         chunk_callback(chunk.copy(), progress)
-                    yield chunk.copy()
-                    chunk.clear()
+                    # Hand the filled list over and start a new one rather than copy + clear
+                    yield chunk
+                    chunk = []
+                    # Re-read chunk_size: the memory threshold check may have lowered it
+                    chunk_target = min(chunk_target * 2, self.config.chunk_size)
                     
-                    # Allow other coroutines to run
-                    await asyncio.sleep(0.001)
+                    # Allow other coroutines to run; sleep(0) yields without a timer round-trip
+                    await asyncio.sleep(0)
             
             # Yield remaining files
             if chunk:
@@ -203,35 +209,56 @@ class FileStreamingService:
     ) -> Iterator[FileInfo]:
         """Synchronous directory scanning (run in thread pool)"""
         
+        # Explicit-stack scandir walk: is_dir() comes from the directory entry's d_type,
+        # so only the stat needed for FileInfo metadata touches each file
+        pending_dirs = [folder_path]
+        
         try:
-            for root, dirs, files in os.walk(folder_path):
-                if self._shutdown:
-                    break
+            while pending_dirs and not self._shutdown:
+                current_dir = pending_dirs.pop()
                 
-                for filename in files:
-                    if self._shutdown:
-                        break
-                    
-                    file_path = os.path.join(root, filename)
-                    
-                    # Apply filter if provided
-                    if file_filter and not file_filter(file_path):
-                        continue
-                    
-                    try:
-                        stat_result = os.stat(file_path)
-                        file_info = FileInfo(
-                            name=filename,
-                            path=file_path,
-                            size=stat_result.st_size,
-                            modified=stat_result.st_mtime,
-                            is_directory=False
-                        )
-                        yield file_info
+                try:
+                    entries = os.scandir(current_dir)
+                except OSError as e:
+                    # os.walk skips unreadable directories too
+                    logger.debug(f"Skipping directory {current_dir}: {e}")
+                    continue
+                
+                subdirs = []
+                with entries:
+                    for entry in entries:
+                        if self._shutdown:
+                            break
+                        
+                        try:
+                            if entry.is_dir():
+                                # Like os.walk, don't descend into symlinked directories
+                                if not entry.is_symlink():
+                                    subdirs.append(entry.path)
+                                continue
+                        except OSError:
+                            pass
                         
-                    except (OSError, PermissionError) as e:
-                        logger.debug(f"Skipping file {file_path}: {e}")
-                        continue
+                        # Apply filter if provided
+                        if file_filter and not file_filter(entry.path):
+                            continue
+                        
+                        try:
+                            file_info = FileInfo(
+                                name=entry.name,
+                                original_name=entry.name,
+                                path=entry.path,
+                                file_type=FileType.FILE,
+                                stat_info=entry.stat()
+                            )
+                            yield file_info
+                            
+                        except (OSError, PermissionError) as e:
+                            logger.debug(f"Skipping file {entry.path}: {e}")
+                            continue
+                
+                # Reversed so subdirectories are visited in listing order, as with os.walk
+                pending_dirs.extend(reversed(subdirs))
                         
         except Exception as e:
             logger.error(f"Error in directory scan: {e}")
@@ -11,6 +11,8 @@ Provides comprehensive Vietnamese text processing capabilities including:
 
 import re
 import os
+import functools
+import unicodedata
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from unidecode import unidecode
@@ -21,6 +23,10 @@ from ..models.config import NormalizationRulesConfig
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Patterns used on every normalization call, compiled once
+_DATE_PATTERN = re.compile(r'\b\d{2}-\d{2}-\d{4}\b')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
 
 @dataclass  
 class NormalizationRules:
@@ -158,6 +164,127 @@ class NormalizationRules:
     def from_dict(cls, data: Dict[str, Any]) -> 'NormalizationRules':
         """Create from dictionary"""
         return cls(**data)
+    
+    def cache_key(self) -> tuple:
+        """Hashable snapshot of every rule, taken fresh since the rules are mutable"""
+        return _rules_cache_key(self)
+
+
+def _rules_cache_key(rules: Any, default_safe_chars: Optional[Dict[str, str]] = None) -> tuple:
+    """
+    Hashable snapshot of a rules object, read attribute by attribute
+    
+    Duck-typed so operation.NormalizationRules, which FileOperationsEngine passes and
+    which has no cache_key(), keys the filename cache the same way. An empty safe
+    character map falls back to default_safe_chars, as clean_special_chars does.
+    """
+    safe_chars = rules.safe_char_replacements or default_safe_chars or {}
+    return (
+        rules.remove_diacritics,
+        rules.lowercase_conversion,
+        rules.clean_special_chars,
+        rules.normalize_whitespace,
+        rules.preserve_extensions,
+        rules.preserve_case_for_extensions,
+        rules.preserve_numbers,
+        rules.preserve_english_words,
+        rules.max_filename_length,
+        rules.min_filename_length,
+        tuple(safe_chars.items()),
+        tuple((rules.custom_replacements or {}).items()),
+    )
+
+
+def _rules_key(config_rules: NormalizationRulesConfig) -> tuple:
+    """Hashable snapshot of the config fields NormalizationRules is built from"""
+    return (
+        config_rules.remove_diacritics,
+        config_rules.convert_to_lowercase,
+        config_rules.clean_special_characters,
+        config_rules.normalize_whitespace,
+        config_rules.preserve_extensions,
+        config_rules.preserve_case_for_extensions,
+        config_rules.preserve_numbers,
+        config_rules.preserve_english_words,
+        config_rules.max_filename_length,
+        config_rules.min_filename_length,
+        tuple(config_rules.custom_replacements.items()),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_rules(rules_key: tuple) -> NormalizationRules:
+    """
+    Build NormalizationRules for a config snapshot, memoized per distinct config
+    
+    The returned instance is shared between callers and must not be mutated.
+    """
+    (remove_diacritics, lowercase_conversion, clean_special_chars, normalize_whitespace,
+     preserve_extensions, preserve_case_for_extensions, preserve_numbers,
+     preserve_english_words, max_filename_length, min_filename_length,
+     custom_items) = rules_key
+    return NormalizationRules(
+        remove_diacritics=remove_diacritics,
+        lowercase_conversion=lowercase_conversion,
+        clean_special_chars=clean_special_chars,
+        normalize_whitespace=normalize_whitespace,
+        preserve_extensions=preserve_extensions,
+        preserve_case_for_extensions=preserve_case_for_extensions,
+        preserve_numbers=preserve_numbers,
+        preserve_english_words=preserve_english_words,
+        max_filename_length=max_filename_length,
+        min_filename_length=min_filename_length,
+        custom_replacements=dict(custom_items)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _replacement_pattern(keys: tuple) -> re.Pattern:
+    """One alternation regex over replacement keys, longest first so they win"""
+    ordered = sorted((key for key in keys if key), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(key) for key in ordered))
+
+
+@functools.lru_cache(maxsize=32)
+def _rules_from_key(rules_key: tuple) -> NormalizationRules:
+    """Rebuild NormalizationRules from NormalizationRules.cache_key() (shared, read-only)"""
+    *flags, safe_items, custom_items = rules_key
+    fields = ('remove_diacritics', 'lowercase_conversion', 'clean_special_chars',
+              'normalize_whitespace', 'preserve_extensions', 'preserve_case_for_extensions',
+              'preserve_numbers', 'preserve_english_words', 'max_filename_length',
+              'min_filename_length')
+    return NormalizationRules(
+        **dict(zip(fields, flags)),
+        safe_char_replacements=dict(safe_items),
+        custom_replacements=dict(custom_items)
+    )
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_filename_cached(filename: str, rules_key: tuple) -> str:
+    """
+    Memoized filename normalization, shared by every VietnameseNormalizer
+    
+    Keyed by rules snapshot rather than instance, so repeated names stay cached
+    across normalizer instances and rule edits can never return stale results.
+    """
+    return _FILENAME_NORMALIZER._normalize_filename(filename, _rules_from_key(rules_key))
+
+
+@functools.lru_cache(maxsize=32)
+def _special_char_table(items: tuple) -> Optional[Dict[int, str]]:
+    """
+    str.translate table equivalent to replacing each non-hyphen key in order
+    
+    Returns None when a sequential replace could differ from a single pass:
+    a multi-character key, or a replacement that contains another key.
+    """
+    mapping = {char: replacement for char, replacement in items if char != '-'}
+    if any(len(char) != 1 for char in mapping):
+        return None
+    if any(char in replacement for replacement in mapping.values() for char in mapping):
+        return None
+    return str.maketrans(mapping)
 
 
 class VietnameseNormalizer:
@@ -171,6 +298,23 @@ class VietnameseNormalizer:
         '₫': 'dong',  # Vietnamese currency symbol
     }
     
+    # Every precomposed Vietnamese letter, lower and upper case
+    _VIETNAMESE_LETTERS = (
+        "àáảãạăằắẳẵặâầấẩẫậèéẻẽẹêềếểễệìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳýỷỹỵđ"
+        "ÀÁẢÃẠĂẰẮẲẴẶÂẦẤẨẪẬÈÉẺẼẸÊỀẾỂỄỆÌÍỈĨỊÒÓỎÕỌÔỒỐỔỖỘƠỜỚỞỠỢÙÚỦŨỤƯỪỨỬỮỰỲÝỶỸỴĐ"
+    )
+    
+    # Combining tone and vowel marks (grave, acute, circumflex, tilde, breve, hook, horn, dot below)
+    _VIETNAMESE_COMBINING_MARKS = "\u0300\u0301\u0302\u0303\u0306\u0309\u031b\u0323"
+    
+    # Single translate() table: unidecode's mapping for each letter, stray marks dropped,
+    # special cases on top
+    _DIACRITIC_TABLE = str.maketrans({
+        **{char: unidecode(char) for char in _VIETNAMESE_LETTERS},
+        **dict.fromkeys(_VIETNAMESE_COMBINING_MARKS, ''),
+        **VIETNAMESE_CHAR_MAP,
+    })
+    
     def __init__(self, rules: Optional[NormalizationRules] = None):
         self.rules = rules or NormalizationRules()
         
@@ -185,20 +329,8 @@ class VietnameseNormalizer:
         Returns:
             VietnameseNormalizer instance
         """
-        # Convert NormalizationRulesConfig to NormalizationRules
-        rules = NormalizationRules(
-            remove_diacritics=config_rules.remove_diacritics,
-            lowercase_conversion=config_rules.convert_to_lowercase,
-            clean_special_chars=config_rules.clean_special_characters,
-            normalize_whitespace=config_rules.normalize_whitespace,
-            preserve_extensions=config_rules.preserve_extensions,
-            preserve_case_for_extensions=config_rules.preserve_case_for_extensions,
-            preserve_numbers=config_rules.preserve_numbers,
-            preserve_english_words=config_rules.preserve_english_words,
-            max_filename_length=config_rules.max_filename_length,
-            min_filename_length=config_rules.min_filename_length,
-            custom_replacements=config_rules.custom_replacements.copy()
-        )
+        # Private copy - callers may tweak normalizer.rules, so skip the shared cache
+        rules = _compile_rules.__wrapped__(_rules_key(config_rules))
         return cls(rules)
         
     def normalize_text_with_config(self, text: str, config_rules: NormalizationRulesConfig) -> str:
@@ -232,20 +364,8 @@ class VietnameseNormalizer:
         return self.normalize_filename(filename, rules)
     
     def _convert_config_to_rules(self, config_rules: NormalizationRulesConfig) -> NormalizationRules:
-        """Convert NormalizationRulesConfig to internal NormalizationRules"""
-        return NormalizationRules(
-            remove_diacritics=config_rules.remove_diacritics,
-            lowercase_conversion=config_rules.convert_to_lowercase,
-            clean_special_chars=config_rules.clean_special_characters,
-            normalize_whitespace=config_rules.normalize_whitespace,
-            preserve_extensions=config_rules.preserve_extensions,
-            preserve_case_for_extensions=config_rules.preserve_case_for_extensions,
-            preserve_numbers=config_rules.preserve_numbers,
-            preserve_english_words=config_rules.preserve_english_words,
-            max_filename_length=config_rules.max_filename_length,
-            min_filename_length=config_rules.min_filename_length,
-            custom_replacements=config_rules.custom_replacements.copy()
-        )
+        """Convert NormalizationRulesConfig to internal NormalizationRules (cached, read-only)"""
+        return _compile_rules(_rules_key(config_rules))
 
     def normalize_text(self, text: str, rules: Optional[NormalizationRules] = None) -> str:
         """
@@ -276,7 +396,8 @@ class VietnameseNormalizer:
             if active_rules.custom_replacements:
                 result = self._apply_custom_replacements(result, active_rules.custom_replacements)
             
-            if active_rules.remove_diacritics:
+            # Pure ASCII text has nothing to fold, only the cheap rules below apply
+            if active_rules.remove_diacritics and not result.isascii():
                 result = self.remove_diacritics(result)
                 
             if active_rules.lowercase_conversion:
@@ -311,7 +432,15 @@ class VietnameseNormalizer:
             return ""
             
         active_rules = rules or self.rules
-        
+        try:
+            rules_key = _rules_cache_key(active_rules, self.rules.safe_char_replacements)
+        except AttributeError:
+            # Rules object without the full field set - normalize uncached
+            return self._normalize_filename(filename, active_rules)
+        return _normalize_filename_cached(filename, rules_key)
+    
+    def _normalize_filename(self, filename: str, active_rules: NormalizationRules) -> str:
+        """Uncached normalize_filename body, run on cache misses"""
         if active_rules.preserve_extensions:
             # Extract filename and extension (only valid file extensions)
             name, ext = os.path.splitext(filename)
@@ -347,12 +476,21 @@ class VietnameseNormalizer:
         if not text:
             return ""
             
-        # Apply Vietnamese-specific character mappings first
-        result = text
-        for viet_char, replacement in self.VIETNAMESE_CHAR_MAP.items():
-            result = result.replace(viet_char, replacement)
+        # Vietnamese letters and special cases in one C-level pass
+        result = text.translate(self._DIACRITIC_TABLE)
+        if result.isascii():
+            return result
+        
+        # The table already folds decomposed Vietnamese. Other decomposed letters
+        # (e.g. Cyrillic on macOS) and canonical singletons transliterate correctly
+        # only once composed. is_normalized() is a quick-check scan, so NFC text
+        # skips the normalize() call
+        if not unicodedata.is_normalized('NFC', result):
+            result = unicodedata.normalize('NFC', result).translate(self._DIACRITIC_TABLE)
+            if result.isascii():
+                return result
         
-        # Apply general Unicode normalization
+        # Apply general Unicode normalization to whatever is left
         try:
             result = unidecode(result)
         except Exception as e:
@@ -396,17 +534,19 @@ class VietnameseNormalizer:
         char_map = replacements or self.rules.safe_char_replacements
         result = text
         
-        # Apply all character replacements except hyphens first
-        for char, replacement in char_map.items():
-            if char != '-':
-                result = result.replace(char, replacement)
+        # Apply all character replacements except hyphens first, in one pass when possible
+        table = _special_char_table(tuple(char_map.items()))
+        if table is not None:
+            result = result.translate(table)
+        else:
+            for char, replacement in char_map.items():
+                if char != '-':
+                    result = result.replace(char, replacement)
         
         # Handle hyphens with date-aware logic
         if '-' in char_map:
-            import re
             # Protect date patterns during hyphen removal
-            date_pattern = r'\b\d{2}-\d{2}-\d{4}\b'
-            dates = re.findall(date_pattern, result)
+            dates = _DATE_PATTERN.findall(result)
             placeholders = {}
             
             # Replace dates with placeholders
@@ -438,7 +578,7 @@ class VietnameseNormalizer:
             return ""
             
         # Collapse multiple whitespace characters to single space
-        result = re.sub(r'\s+', ' ', text)
+        result = _WHITESPACE_PATTERN.sub(' ', text)
         
         # Trim leading and trailing whitespace
         result = result.strip()
@@ -459,11 +599,9 @@ class VietnameseNormalizer:
         if not text or not custom_replacements:
             return text
             
-        result = text
-        for char, replacement in custom_replacements.items():
-            result = result.replace(char, replacement)
-        
-        return result
+        # Single scan; replacement output is never rescanned by later keys
+        pattern = _replacement_pattern(tuple(custom_replacements))
+        return pattern.sub(lambda match: custom_replacements[match.group(0)], text)
     
     def preview_normalization(self, text: str, rules: Optional[NormalizationRules] = None) -> Dict[str, Any]:
         """
@@ -563,4 +701,8 @@ class VietnameseNormalizer:
                     validation['errors'].append(f"Invalid character mapping: {char} -> {replacement}")
                     validation['valid'] = False
                     
-        return validation
\ No newline at end of file
+        return validation
+
+
+# Worker for _normalize_filename_cached; the rules always come from the cache key
+_FILENAME_NORMALIZER = VietnameseNormalizer()
\ No newline at end of file
@@ -19,6 +19,9 @@ from ..models.error_models import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Path prefixes of network locations (Windows UNC and forward-slash UNC)
+_NETWORK_PREFIXES = ('\\\\', '//')
+
 
 class FileNameValidator:
     """
@@ -612,11 +615,13 @@ class DragDropFolderValidator:
         result.warnings.extend(access_result.warnings)
         result.is_valid = result.is_valid and access_result.is_valid
         
-        # Additional drag-drop specific validations
-        self._validate_folder_suitability(folder_path, result)
+        # Additional drag-drop specific validations - the folder is read
+        # once and its entries are shared by the content based checks
+        entries = self._validate_folder_suitability(folder_path, result)
         self._validate_network_location(folder_path, result)
-        self._validate_folder_size(folder_path, result)
-        self._check_previous_operations(folder_path, result)
+        if entries is not None:
+            self._validate_folder_size(folder_path, result, entries)
+            self._check_previous_operations(folder_path, result, entries)
         
         return result
     
@@ -737,30 +742,20 @@ class DragDropFolderValidator:
         
         return suggestions
     
-    def _validate_folder_suitability(self, folder_path: str, result: ValidationResult):
-        """Check if folder is suitable for file operations"""
+    def _validate_folder_suitability(self, folder_path: str,
+                                     result: ValidationResult) -> Optional[List[os.DirEntry]]:
+        """
+        Check if folder is suitable for file operations
+        
+        Returns:
+            Folder entries from a single directory read, or None if the
+            folder could not be read
+        """
         try:
-            # Check if folder has any processable files
-            files = os.listdir(folder_path)
-            processable_files = [f for f in files if not f.startswith('.') and os.path.isfile(os.path.join(folder_path, f))]
-            
-            if not processable_files:
-                result.add_warning(
-                    ValidationErrorCode.INVALID_CHARACTER,
-                    "Folder contains no processable files",
-                    "folder_contents",
-                    folder_path,
-                    "Select a folder with files to rename"
-                )
-            elif len(processable_files) > 1000:
-                result.add_warning(
-                    ValidationErrorCode.TOO_LONG,
-                    f"Folder contains many files ({len(processable_files)}), processing may be slow",
-                    "folder_size",
-                    folder_path,
-                    "Consider processing in smaller batches"
-                )
-                
+            # DirEntry caches the file type from the directory read, so no
+            # per-file stat is needed to find processable files
+            with os.scandir(folder_path) as it:
+                entries = list(it)
         except OSError as e:
             result.add_error(
                 ValidationErrorCode.INVALID_CHARACTER,
@@ -769,12 +764,35 @@ class DragDropFolderValidator:
                 folder_path,
                 "Check folder permissions and try again"
             )
+            return None
+        
+        # Check if folder has any processable files
+        processable_files = [e.name for e in entries if not e.name.startswith('.') and e.is_file()]
+        
+        if not processable_files:
+            result.add_warning(
+                ValidationErrorCode.INVALID_CHARACTER,
+                "Folder contains no processable files",
+                "folder_contents",
+                folder_path,
+                "Select a folder with files to rename"
+            )
+        elif len(processable_files) > 1000:
+            result.add_warning(
+                ValidationErrorCode.TOO_LONG,
+                f"Folder contains many files ({len(processable_files)}), processing may be slow",
+                "folder_size",
+                folder_path,
+                "Consider processing in smaller batches"
+            )
+        
+        return entries
     
     def _validate_network_location(self, folder_path: str, result: ValidationResult):
         """Check for network drive issues"""
         try:
             # Check if path is on network drive (Windows UNC path)
-            if folder_path.startswith(r'\\') or ':' not in folder_path:
+            if folder_path.startswith(_NETWORK_PREFIXES) or ':' not in folder_path:
                 result.add_warning(
                     ValidationErrorCode.INVALID_CHARACTER,
                     "Folder is on network drive - operations may be slower",
@@ -787,15 +805,22 @@ class DragDropFolderValidator:
             # Non-critical check, continue
             pass
     
-    def _validate_folder_size(self, folder_path: str, result: ValidationResult):
+    def _validate_folder_size(self, folder_path: str, result: ValidationResult,
+                              entries: List[os.DirEntry]):
         """Check folder size for performance warnings"""
         try:
-            # Quick size estimation
-            file_count = 0
-            for root, dirs, files in os.walk(folder_path):
-                file_count += len(files)
-                if file_count > 100:  # Stop counting at reasonable limit for warning
-                    break
+            # Quick size estimation - top level comes from the entries already
+            # read, subfolders are only walked while the count is still low
+            file_count = sum(1 for e in entries if not e.is_dir())
+            if file_count <= 100:
+                subfolders = [e.path for e in entries if e.is_dir() and not e.is_symlink()]
+                for subfolder in subfolders:
+                    for root, dirs, files in os.walk(subfolder):
+                        file_count += len(files)
+                        if file_count > 100:  # Stop counting at reasonable limit for warning
+                            break
+                    if file_count > 100:
+                        break
             
             if file_count > 500:
                 result.add_warning(
@@ -810,11 +835,12 @@ class DragDropFolderValidator:
             # Non-critical check
             pass
     
-    def _check_previous_operations(self, folder_path: str, result: ValidationResult):
+    def _check_previous_operations(self, folder_path: str, result: ValidationResult,
+                                   entries: List[os.DirEntry]):
         """Check for signs of previous rename operations"""
         try:
             # Look for common patterns that suggest previous operations
-            files = os.listdir(folder_path)
+            files = [e.name for e in entries]
             
             # Check for numbered sequences that might indicate previous batch renames
             numbered_files = [f for f in files if any(char.isdigit() for char in f)]
@@ -219,7 +219,12 @@ class AppController:
             self._update_undo_button_state(state)
     
     def _update_undo_button_state(self, state: ApplicationState):
-        """Update undo button state with enhanced validation and tooltip"""
+        """
+        Update undo button state with enhanced validation and tooltip
+        
+        Runs inside the state observer, so its state writes use notify=False;
+        notifying would re-enter _on_state_changed and recurse without end.
+        """
         try:
             # Check if there's an undoable operation for current folder
             last_operation = self.undo_service.get_last_undoable_operation(state.selected_folder)
@@ -238,6 +243,7 @@ class AppController:
                     
                     # Update state for UI consistency
                     self.state_manager.update_state(
+                        notify=False,
                         can_undo_last_operation=True,
                         last_operation_id=last_operation['operation_id'],
                         undo_button_tooltip=tooltip_text,
@@ -252,6 +258,7 @@ class AppController:
                     
                     # Update state
                     self.state_manager.update_state(
+                        notify=False,
                         can_undo_last_operation=False,
                         undo_button_tooltip=tooltip_text,
                         undo_disabled_reason=eligibility.primary_reason
@@ -266,6 +273,7 @@ class AppController:
                     
                 # Update state
                 self.state_manager.update_state(
+                    notify=False,
                     can_undo_last_operation=False,
                     last_operation_id=None,
                     undo_button_tooltip=tooltip_text,
@@ -280,6 +288,7 @@ class AppController:
             
             # Update state
             self.state_manager.update_state(
+                notify=False,
                 can_undo_last_operation=False,
                 undo_button_tooltip=tooltip_text,
                 undo_disabled_reason=str(e)
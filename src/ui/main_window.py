@@ -56,16 +56,23 @@ class StateManager:
     def subscribe(self, observer: Callable[[ApplicationState], None]):
         self._observers.append(observer)
 
-    def update_state(self, **kwargs):
+    def update_state(self, *, notify: bool = True, **kwargs):
+        """Apply all fields at once; pass notify=False to skip the observer fan-out"""
         for key, value in kwargs.items():
             if hasattr(self.state, key):
                 setattr(self.state, key, value)
-        self._notify_observers()
+        if notify:
+            self._notify_observers()
 
     def _notify_observers(self):
         for observer in self._observers:
             observer(self.state)
 
+    def reset(self):
+        """Restore the default state and drop all observers"""
+        self.state = ApplicationState()
+        self._observers.clear()
+
 
 class MainWindow:
     def __init__(self):
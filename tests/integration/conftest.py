@@ -0,0 +1,180 @@
+"""
+Shared fixtures for integration tests
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.models.file_info import FileInfo
+from src.core.services.validation_service import get_drag_drop_validator
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """Drag-drop folder validator shared by all tests in a module"""
+    return get_drag_drop_validator()
+
+
+@pytest.fixture(scope="session")
+def config_db_path(worker_id):
+    """
+    Named shared-cache in-memory SQLite database, one per xdist worker
+    
+    Every thread's DatabaseService connection sees the same data, unlike
+    plain ':memory:' which gives each connection its own empty database.
+    """
+    return f"file:mini_tool_config_{worker_id}?mode=memory&cache=shared"
+
+
+@pytest.fixture(scope="session")
+def sample_files():
+    """Canonical FileInfo corpus; tests that mutate it take list(sample_files)"""
+    return (
+        FileInfo("Tài liệu.txt", "Tài liệu.txt", "/test/Tài liệu.txt", None),
+        FileInfo("Báo cáo.docx", "Báo cáo.docx", "/test/Báo cáo.docx", None),
+    )
+
+
+VIETNAMESE_CORPUS = {
+    "": [
+        "Tài liệu quan trọng.txt",
+        "Báo cáo tài chính Q4.xlsx",
+        "Hướng dẫn sử dụng (phiên bản mới).pdf",
+        "Ảnh đại diện - Nguyễn Văn A.jpg",
+        "Danh sách nhân viên & Lương.docx",
+        "File@test#special!chars.txt",
+        "DOCUMENT   WITH   SPACES.doc",
+        "file.without.vietnamese.txt",
+    ],
+    "Thư mục con": [
+        "Tệp trong thư mục con.txt",
+        "Another file.pdf",
+    ],
+}
+
+
+@pytest.fixture(scope="session")
+def readonly_vietnamese_corpus(tmp_path_factory):
+    """
+    Folder of Vietnamese-named files built once per session.
+
+    Tests using this fixture must not rename, delete or create files in it;
+    destructive tests build their own folder under tmp_path.
+    """
+    root = tmp_path_factory.mktemp("vietnamese_corpus")
+    for sub_dir, names in VIETNAMESE_CORPUS.items():
+        folder = root / sub_dir
+        folder.mkdir(exist_ok=True)
+        for name in names:
+            (folder / name).write_bytes(b"test content")
+    return root
+
+
+
+@pytest.fixture(scope="session")
+def temp_directory_with_files(tmp_path_factory):
+    """Directory of Vietnamese test files, created once per session"""
+    temp_dir = tmp_path_factory.mktemp("vn_files")
+    test_files = [
+        "Tài liệu quan trọng.txt",
+        "Báo cáo tháng 12 năm 2024.docx",
+        "Ảnh đại diện (mới).jpg",
+        "Hướng dẫn sử dụng & Cài đặt.pdf",
+        "File với ký tự đặc biệt!@#$%^&*().txt",
+    ]
+
+    created_files = []
+    for filename in test_files:
+        file_path = temp_dir / filename
+        file_path.write_text(f"Test content for {filename}", encoding="utf-8")
+        created_files.append(str(file_path))
+
+    return str(temp_dir), created_files
+
+
+@pytest.fixture
+def mock_tkinter_root():
+    """Mock tkinter root for testing without GUI"""
+    return SimpleNamespace(
+        winfo_screenwidth=lambda: 1920,
+        winfo_screenheight=lambda: 1080,
+        winfo_rootx=lambda: 100,
+        winfo_rooty=lambda: 100,
+        winfo_width=lambda: 800,
+        winfo_height=lambda: 600,
+    )
+
+
+# AppController attributes that tests swap for mocks
+_SWAPPABLE_ATTRS = (
+    "batch_service", "history_service", "undo_service", "db_service", "file_preview",
+    "progress_dialog", "rename_button", "undo_button", "_current_files",
+)
+
+
+def _reset_controller_state(controller, saved):
+    """Put back attributes swapped by a test and return to the default state"""
+    from src.ui.main_window import ApplicationState
+
+    for name in _SWAPPABLE_ATTRS:
+        setattr(controller, name, saved[name])
+    controller.main_window.root = saved["root"]
+    # Assign directly so observers are not fired with a finished test's mocks
+    controller.state_manager.state = ApplicationState()
+    controller._updating_file_preview = False
+
+
+@contextmanager
+def _patched_controller():
+    """Build an AppController with Tk patched out for as long as the context is open"""
+    # Imported here so collecting other modules does not load the Tk stack
+    from src.ui.components.app_controller import AppController
+
+    # MainWindow builds its root through TkinterDnD.Tk, a real tkinter.Tk subclass.
+    # With a mock root there is no default root, so masterless Style/StringVar go too
+    with patch("src.ui.components.app_controller.tk.Tk"), patch("src.ui.main_window.TkinterDnD"), \
+            patch("tkinter.ttk.Style"), patch("tkinter.StringVar"):
+        yield AppController()
+
+
+@pytest.fixture(scope="class")
+def _shared_controller():
+    """AppController built once per class"""
+    with _patched_controller() as controller:
+        yield controller
+        controller.destroy()
+
+
+@pytest.fixture
+def controller(_shared_controller):
+    """Shared controller, restored to its original wiring after each test"""
+    saved = {name: getattr(_shared_controller, name) for name in _SWAPPABLE_ATTRS}
+    saved["root"] = _shared_controller.main_window.root
+    # The folder-change refresh runs on a thread that would outlive the test and
+    # clear _updating_file_preview during the next one, so it is never started
+    with patch("threading.Thread"):
+        yield _shared_controller
+    _reset_controller_state(_shared_controller, saved)
+
+
+@pytest.fixture
+def mocked_messagebox(monkeypatch):
+    """Replace the controller's messagebox module; askyesno always confirms"""
+    messagebox = SimpleNamespace(
+        askyesno=MagicMock(return_value=True),
+        showinfo=MagicMock(),
+        showwarning=MagicMock(),
+        showerror=MagicMock(),
+    )
+    monkeypatch.setattr('src.ui.components.app_controller.messagebox', messagebox)
+    return messagebox
+
+
+@pytest.fixture
+def fresh_controller():
+    """Private AppController for tests that tear it down themselves"""
+    with _patched_controller() as controller:
+        yield controller
@@ -6,9 +6,11 @@ Tests complete drag-drop workflows, error handling, and component integration.
 
 import pytest
 import unittest.mock as mock
+from hypothesis import given, strategies
 import os
-import tempfile
-import shutil
+import subprocess
+import sys
+from contextlib import contextmanager
 from pathlib import Path
 import tkinter as tk
 from typing import Dict, Any
@@ -16,48 +18,131 @@ from typing import Dict, Any
 # Test imports - adjust paths as needed for your project structure
 from src.ui.main_window import MainWindow, StateManager
 from src.ui.components.folder_selector import FolderSelectorComponent
-from src.core.services.validation_service import get_drag_drop_validator
+
+
+@contextmanager
+def fake_fs(exists=True, isdir=True, access=True, files=()):
+    """Fake the os calls made by folder validation with a single patch"""
+    entries = []
+    for name in files:
+        entry = mock.MagicMock()
+        entry.name = name
+        entry.is_dir.return_value = False
+        entries.append(entry)
+    
+    with mock.patch.multiple('os', path=mock.DEFAULT, access=mock.DEFAULT,
+                             scandir=mock.DEFAULT) as m:
+        m['path'].exists.return_value = exists
+        m['path'].isdir.return_value = isdir
+        m['access'].return_value = access
+        m['scandir'].return_value.__enter__.return_value = entries
+        yield m
+
+
+@pytest.fixture(scope="session")
+def large_folder(tmp_path_factory):
+    """Create a folder with many files once for the whole session"""
+    folder = tmp_path_factory.mktemp("large")
+    paths = [folder / f"file_{i:03d}.txt" for i in range(100)]  # Reasonable number for testing
+    if sys.platform != 'win32':
+        # One touch process creates every file instead of 100 Python opens
+        subprocess.run(['touch', *map(str, paths)], check=True)
+    else:
+        for path in paths:
+            path.touch()
+    return str(folder)
+
+
+@pytest.fixture
+def temp_folder_with_files(fs):
+    """Create in-memory folder with test files"""
+    temp_dir = '/fake/folder'
+    fs.create_dir(temp_dir)
+    
+    # Create empty test files with different extensions - only the
+    # directory entries matter, no test reads the contents
+    test_files = (
+        "document1.txt",
+        "document2.pdf",
+        "image1.jpg",
+        "spreadsheet.xlsx",
+        "presentation.pptx",
+    )
+    
+    for filename in test_files:
+        fs.create_file(f'{temp_dir}/{filename}')
+    
+    return temp_dir
+
+
+class _FakeStringVar:
+    """StringVar stand-in that keeps its value and fires write traces without a Tk root"""
+    
+    def __init__(self, value=""):
+        self._value = value
+        self._traces = []
+    
+    def get(self):
+        return self._value
+    
+    def set(self, value):
+        self._value = value
+        for callback in self._traces:
+            callback()
+    
+    def trace(self, mode, callback):
+        self._traces.append(callback)
+
+
+@pytest.fixture(scope="module")
+def _patch_tk():
+    """Patch the tkinter widgets once for the module's folder selector tests"""
+    with mock.patch('tkinter.Tk'), mock.patch('tkinter.StringVar', _FakeStringVar), \
+            mock.patch.multiple('tkinter.ttk', Frame=mock.DEFAULT, Label=mock.DEFAULT,
+                                Entry=mock.DEFAULT, Button=mock.DEFAULT):
+        yield
+
+
+@pytest.fixture(scope="module")
+def _shared_main_window():
+    """Create mock main window once for the module"""
+    with mock.patch('src.ui.main_window.TkinterDnD'), mock.patch('tkinter.Tk'), \
+            mock.patch('tkinter.ttk.Style'):
+        yield MainWindow()
+
+
+@pytest.fixture(scope="module")
+def _folder_selector_spec_mock():
+    """Spec'd folder selector mock, built once per module"""
+    return mock.MagicMock(spec=FolderSelectorComponent)
+
+
+@pytest.fixture(scope="module")
+def _shared_state_manager():
+    """State manager built once for the module's state tests"""
+    return StateManager()
 
 
 class TestDragDropWorkflowIntegration:
     """Test complete drag-drop workflow integration"""
     
     @pytest.fixture
-    def temp_folder_with_files(self):
-        """Create temporary folder with test files"""
-        temp_dir = tempfile.mkdtemp()
-        
-        # Create test files with different extensions
-        test_files = [
-            "document1.txt",
-            "document2.pdf", 
-            "image1.jpg",
-            "spreadsheet.xlsx",
-            "presentation.pptx"
-        ]
-        
-        for filename in test_files:
-            with open(os.path.join(temp_dir, filename), 'w') as f:
-                f.write(f"Test content for {filename}")
-        
-        yield temp_dir
-        
-        # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    def mock_main_window(self, _shared_main_window):
+        """Main window with components and state reset after each test"""
+        yield _shared_main_window
+        _shared_main_window.components.clear()
+        _shared_main_window.state_manager.reset()
     
     @pytest.fixture
-    def mock_main_window(self):
-        """Create mock main window for testing"""
-        with mock.patch('src.ui.main_window.TkinterDnD'):
-            with mock.patch('tkinter.Tk'):
-                with mock.patch('tkinter.ttk.Style'):
-                    window = MainWindow()
-                    return window
+    def mock_folder_selector(self, _folder_selector_spec_mock):
+        """Folder selector mock reset after each test"""
+        yield _folder_selector_spec_mock
+        _folder_selector_spec_mock.reset_mock()
     
-    def test_complete_drag_drop_workflow(self, temp_folder_with_files, mock_main_window):
+    def test_complete_drag_drop_workflow(self, temp_folder_with_files, mock_main_window,
+                                         mock_folder_selector):
         """Test complete drag-drop workflow from start to finish"""
         # Setup components
-        mock_folder_selector = mock.MagicMock(spec=FolderSelectorComponent)
         mock_main_window.components['folder_selector'] = mock_folder_selector
         
         # Test folder drop
@@ -75,35 +160,29 @@ class TestDragDropWorkflowIntegration:
     def test_drag_drop_with_file_list_refresh(self, temp_folder_with_files, mock_main_window):
         """Test that file list refreshes after successful drop"""
         # Setup file preview component
-        mock_file_preview = mock.MagicMock()
+        mock_file_preview = mock.MagicMock(spec=['refresh_file_list'])
         mock_main_window.components['file_preview'] = mock_file_preview
         
         # Test folder drop
         mock_main_window.handle_folder_drop(temp_folder_with_files)
         
         # Verify file list refresh was triggered
-        if hasattr(mock_file_preview, 'refresh_file_list'):
-            mock_file_preview.refresh_file_list.assert_called_once()
-        elif hasattr(mock_file_preview, 'scan_folder'):
-            mock_file_preview.scan_folder.assert_called_once_with(temp_folder_with_files)
+        mock_file_preview.refresh_file_list.assert_called_once()
     
     def test_drag_drop_with_app_controller_notification(self, temp_folder_with_files, mock_main_window):
         """Test that app controller is notified of folder selection"""
         # Setup app controller
-        mock_app_controller = mock.MagicMock()
+        mock_app_controller = mock.MagicMock(spec=['on_folder_selected'])
         mock_main_window.components['app_controller'] = mock_app_controller
         
         # Test folder drop
         mock_main_window.handle_folder_drop(temp_folder_with_files)
         
         # Verify app controller was notified
-        if hasattr(mock_app_controller, 'on_folder_selected'):
-            mock_app_controller.on_folder_selected.assert_called_once_with(temp_folder_with_files)
+        mock_app_controller.on_folder_selected.assert_called_once_with(temp_folder_with_files)
     
-    def test_drag_validation_integration(self, temp_folder_with_files):
+    def test_drag_validation_integration(self, temp_folder_with_files, validator):
         """Test drag validation integration with validation service"""
-        validator = get_drag_drop_validator()
-        
         # Test single folder validation
         results = validator.validate_multiple_drops([temp_folder_with_files])
         
@@ -128,21 +207,15 @@ class TestErrorHandlingIntegration:
     """Test error handling across drag-drop components"""
     
     @pytest.fixture
-    def temp_file_not_folder(self):
-        """Create temporary file (not folder) for testing"""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt')
-        temp_file.write("Test file content")
-        temp_file.close()
-        
-        yield temp_file.name
+    def temp_file_not_folder(self, fs):
+        """Create in-memory file (not folder) for testing"""
+        temp_file = '/fake/not_a_folder.txt'
+        fs.create_file(temp_file)
         
-        # Cleanup
-        os.unlink(temp_file.name)
+        return temp_file
     
-    def test_file_drop_rejection(self, temp_file_not_folder):
+    def test_file_drop_rejection(self, temp_file_not_folder, validator):
         """Test that dropping files is properly rejected"""
-        validator = get_drag_drop_validator()
-        
         results = validator.validate_multiple_drops([temp_file_not_folder])
         
         assert temp_file_not_folder in results
@@ -152,66 +225,54 @@ class TestErrorHandlingIntegration:
         errors = results[temp_file_not_folder].errors
         assert any("Files are not accepted" in error.message for error in errors)
     
-    def test_multiple_folder_drop_handling(self):
+    def test_multiple_folder_drop_handling(self, validator, tmp_path):
         """Test handling multiple folder drops"""
-        temp_dir1 = tempfile.mkdtemp()
-        temp_dir2 = tempfile.mkdtemp()
-        
-        try:
-            validator = get_drag_drop_validator()
-            
-            results = validator.validate_multiple_drops([temp_dir1, temp_dir2])
-            
-            # First folder should be valid but with warning
-            assert results[temp_dir1].is_valid
-            warnings = results[temp_dir1].warnings
-            assert any("Multiple folders dropped" in warning.message for warning in warnings)
-            
-            # Second folder should have warning about being ignored
-            warnings = results[temp_dir2].warnings
-            assert any("Folder ignored" in warning.message for warning in warnings)
-            
-        finally:
-            shutil.rmtree(temp_dir1, ignore_errors=True)
-            shutil.rmtree(temp_dir2, ignore_errors=True)
+        temp_dir1 = tmp_path / "a"
+        temp_dir2 = tmp_path / "b"
+        temp_dir1.mkdir()
+        temp_dir2.mkdir()
+        temp_dir1, temp_dir2 = str(temp_dir1), str(temp_dir2)
+        
+        results = validator.validate_multiple_drops([temp_dir1, temp_dir2])
+        
+        # First folder should be valid but with warning
+        assert results[temp_dir1].is_valid
+        warnings = results[temp_dir1].warnings
+        assert any("Multiple folders dropped" in warning.message for warning in warnings)
+        
+        # Second folder should have warning about being ignored
+        warnings = results[temp_dir2].warnings
+        assert any("Folder ignored" in warning.message for warning in warnings)
     
-    def test_permission_error_handling(self):
+    def test_permission_error_handling(self, validator):
         """Test handling permission errors during validation"""
-        validator = get_drag_drop_validator()
-        
         # Mock a folder that exists but is not readable
-        with mock.patch('os.path.exists', return_value=True):
-            with mock.patch('os.path.isdir', return_value=True):
-                with mock.patch('os.access', return_value=False):  # No read access
-                    
-                    result = validator.validate_dropped_folder("/restricted/folder")
-                    
-                    assert not result.is_valid
-                    assert any("not readable" in error.message for error in result.errors)
+        with fake_fs(access=False):  # No read access
+            result = validator.validate_dropped_folder("/restricted/folder")
+            
+            assert not result.is_valid
+            assert any("not readable" in error.message for error in result.errors)
     
-    def test_network_drive_warning(self):
+    @pytest.mark.parametrize("folder_path,is_network", [
+        (r"\\server\share\folder", True),
+        ("//server/share/folder", True),
+        (r"C:\Users\test\folder", False),
+        # Without a drive colon the path cannot be ruled out as a mapped share
+        ("/mnt/test/folder", True),
+    ], ids=["unc", "forward-slash-unc", "drive-letter", "no-drive-colon"])
+    def test_network_drive_warning(self, validator, folder_path, is_network):
         """Test network drive warning generation"""
-        validator = get_drag_drop_validator()
-        
-        # Test UNC path (Windows network drive)
-        unc_path = r"\\server\share\folder"
-        
-        with mock.patch('os.path.exists', return_value=True):
-            with mock.patch('os.path.isdir', return_value=True):
-                with mock.patch('os.access', return_value=True):
-                    with mock.patch('os.listdir', return_value=['file1.txt', 'file2.txt']):
-                        
-                        result = validator.validate_dropped_folder(unc_path)
-                        
-                        # Should have network drive warning
-                        warnings = result.warnings
-                        assert any("network drive" in warning.message.lower() 
-                                  for warning in warnings)
+        with fake_fs(files=('file1.txt', 'file2.txt')):
+            result = validator.validate_dropped_folder(folder_path)
+        
+        # Network folders still validate, with a warning only
+        assert result.is_valid
+        has_network_warning = any("network drive" in warning.message.lower()
+                                  for warning in result.warnings)
+        assert has_network_warning == is_network
     
-    def test_error_recovery_suggestions(self):
+    def test_error_recovery_suggestions(self, validator):
         """Test error recovery suggestion generation"""
-        validator = get_drag_drop_validator()
-        
         # Create validation result with various errors
         from src.core.models.error_models import ValidationResult, ValidationErrorCode
         
@@ -224,8 +285,12 @@ class TestErrorHandlingIntegration:
             "Check permissions"
         )
         
-        suggestions = validator.get_error_recovery_suggestions(result)
+        # Suggestions are mapped from the errors alone, without probing the disk
+        with mock.patch('src.core.services.validation_service.os.path.exists',
+                        return_value=False) as mock_exists:
+            suggestions = validator.get_error_recovery_suggestions(result)
         
+        mock_exists.assert_not_called()
         assert len(suggestions) > 0
         
         # Should include browse dialog fallback
@@ -237,13 +302,18 @@ class TestErrorHandlingIntegration:
         assert any('Browse Dialog' in desc for desc in descriptions)
 
 
+@pytest.mark.fast
 class TestStateManagementIntegration:
     """Test state management across drag-drop operations"""
     
-    def test_state_manager_drag_state_tracking(self):
+    @pytest.fixture
+    def state_manager(self, _shared_state_manager):
+        """State manager reset to defaults after each test"""
+        yield _shared_state_manager
+        _shared_state_manager.reset()
+    
+    def test_state_manager_drag_state_tracking(self, state_manager):
         """Test state manager tracks drag states correctly"""
-        state_manager = StateManager()
-        
         # Test initial state
         initial_state = state_manager.state
         assert not initial_state.is_drag_active
@@ -276,10 +346,8 @@ class TestStateManagementIntegration:
         assert not final_state.drag_drop_valid
         assert final_state.pending_folder_drop is None
     
-    def test_state_observer_notification(self):
+    def test_state_observer_notification(self, state_manager):
         """Test that state observers are notified of drag-drop changes"""
-        state_manager = StateManager()
-        
         # Setup mock observer
         mock_observer = mock.MagicMock()
         state_manager.subscribe(mock_observer)
@@ -297,25 +365,33 @@ class TestStateManagementIntegration:
         call_args = mock_observer.call_args[0]
         updated_state = call_args[0]
         assert updated_state.selected_folder == "/new/folder"
+    
+    @given(strategies.lists(strategies.text(), min_size=1, max_size=20))
+    def test_observer_notified_for_every_update(self, folders):
+        """Test observers are notified once per update across many sequences"""
+        state_manager = StateManager()
+        mock_observer = mock.MagicMock()
+        state_manager.subscribe(mock_observer)
+        
+        for folder in folders:
+            state_manager.update_state(selected_folder=folder)
+        
+        assert mock_observer.call_count == len(folders)
+        assert state_manager.state.selected_folder == folders[-1]
 
 
+@pytest.mark.fast
+@pytest.mark.usefixtures("_patch_tk")
 class TestFolderSelectorIntegration:
     """Test folder selector component integration with drag-drop"""
     
     @pytest.fixture
     def folder_selector_component(self):
         """Create folder selector component for testing"""
-        with mock.patch('tkinter.Tk'):  # Create root window first
-            with mock.patch('tkinter.ttk.Frame'):
-                with mock.patch('tkinter.ttk.Label'):
-                    with mock.patch('tkinter.ttk.Entry'):
-                        with mock.patch('tkinter.ttk.Button'):
-                            with mock.patch('tkinter.StringVar'):
-                                mock_parent = mock.MagicMock()
-                                mock_callback = mock.MagicMock()
-                                
-                                component = FolderSelectorComponent(mock_parent, mock_callback)
-                                return component
+        mock_parent = mock.MagicMock()
+        mock_callback = mock.MagicMock()
+        
+        return FolderSelectorComponent(mock_parent, mock_callback)
     
     def test_set_folder_from_drag_drop(self, folder_selector_component, temp_folder_with_files):
         """Test setting folder via drag-drop method"""
@@ -368,33 +444,17 @@ class TestFolderSelectorIntegration:
 class TestPerformanceIntegration:
     """Test performance aspects of drag-drop integration"""
     
-    def test_large_folder_validation_performance(self):
+    def test_large_folder_validation_performance(self, large_folder, validator):
         """Test validation performance with large folders"""
-        validator = get_drag_drop_validator()
-        
-        # Create mock large folder
-        large_folder = tempfile.mkdtemp()
-        
-        try:
-            # Create many files to simulate large folder
-            for i in range(100):  # Reasonable number for testing
-                with open(os.path.join(large_folder, f"file_{i:03d}.txt"), 'w') as f:
-                    f.write(f"Content {i}")
-            
-            import time
-            start_time = time.time()
-            
+        # Count directory reads and stats rather than wall-clock time - the
+        # validator should read the folder once, not stat every file in it
+        with mock.patch('os.scandir', wraps=os.scandir) as sc, \
+                mock.patch('os.stat', wraps=os.stat) as st:
             result = validator.validate_dropped_folder(large_folder)
-            
-            end_time = time.time()
-            validation_time = end_time - start_time
-            
-            # Validation should complete reasonably quickly (under 5 seconds)
-            assert validation_time < 5.0
-            assert result.is_valid
-            
-        finally:
-            shutil.rmtree(large_folder, ignore_errors=True)
+        
+        assert sc.call_count <= 1
+        assert st.call_count <= 2
+        assert result.is_valid
     
     def test_validation_caching(self):
         """Test that validation results are cached for performance"""
@@ -405,24 +465,17 @@ class TestPerformanceIntegration:
         # Test same filename validation multiple times
         filename = "test_file.txt"
         
-        import time
-        
-        # First validation (should cache result)
-        start_time = time.time()
-        result1 = validator.validate_filename(filename)
-        first_time = time.time() - start_time
-        
-        # Second validation (should use cache)
-        start_time = time.time()
-        result2 = validator.validate_filename(filename)
-        second_time = time.time() - start_time
+        with mock.patch.object(validator, '_validate_characters',
+                               wraps=validator._validate_characters) as spy:
+            result1 = validator.validate_filename(filename)
+            result2 = validator.validate_filename(filename)
         
         # Results should be identical
         assert result1.is_valid == result2.is_valid
         assert len(result1.errors) == len(result2.errors)
         
-        # Second call should be faster (cached)
-        assert second_time <= first_time or second_time < 0.001  # Very small threshold
+        # Second call should be served from the cache
+        assert spy.call_count == 1
 
 
 if __name__ == '__main__':
@@ -11,12 +11,11 @@ Tests end-to-end file processing workflows including:
 import pytest
 import sys
 import os
-import tempfile
+import stat
+import ctypes
 import shutil
 from pathlib import Path
-
-# Add src directory to path  
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from types import SimpleNamespace
 
 from core.services.file_operations_engine import FileOperationsEngine
 from core.services.normalize_service import VietnameseNormalizer, NormalizationRules
@@ -24,64 +23,125 @@ from core.models.file_info import FileInfo, FileType, OperationStatus
 from core.models.operation import BatchOperation, OperationType
 
 
-class TestFileOperationsIntegration:
-    @pytest.fixture
-    def temp_folder_with_vietnamese_files(self):
-        """Create temporary folder with Vietnamese test files"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test files with Vietnamese names
-            test_files = [
-                "Tài liệu quan trọng.txt",
-                "Báo cáo tài chính Q4.xlsx", 
-                "Hướng dẫn sử dụng (phiên bản mới).pdf",
-                "Ảnh đại diện - Nguyễn Văn A.jpg",
-                "Danh sách nhân viên & Lương.docx",
-                "File@test#special!chars.txt",
-                "DOCUMENT   WITH   SPACES.doc",
-                "file.without.vietnamese.txt"
-            ]
-            
-            for filename in test_files:
-                file_path = os.path.join(temp_dir, filename)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"Test content for {filename}")
-            
-            # Create a subdirectory with files
-            sub_dir = os.path.join(temp_dir, "Thư mục con")
-            os.makedirs(sub_dir)
-            
-            sub_files = [
-                "Tệp trong thư mục con.txt", 
-                "Another file.pdf"
-            ]
-            
-            for filename in sub_files:
-                file_path = os.path.join(sub_dir, filename)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"Sub folder content: {filename}")
-            
-            yield temp_dir
-    
-    @pytest.fixture
-    def file_engine(self):
-        """Create FileOperationsEngine with Vietnamese normalizer"""
-        normalizer = VietnameseNormalizer()
-        return FileOperationsEngine(normalizer)
+# File contents are never asserted on, so every test file gets the same bytes
+_DUMMY: bytes = b"test content"
+
+# Shared rule sets; tests must not mutate them
+_DEFAULT_RULES = NormalizationRules()
+_VN_RULES = NormalizationRules(
+    remove_diacritics=True,
+    lowercase_conversion=True,
+    clean_special_chars=True,
+    normalize_whitespace=True,
+    preserve_extensions=True
+)
+
+# Names the scan tests expect to find in the read-only corpus
+_EXPECTED_TOP_LEVEL = frozenset({"Tài liệu quan trọng.txt", "Báo cáo tài chính Q4.xlsx", "Thư mục con"})
+_EXPECTED_RECURSIVE_ADDITIONS = frozenset({"Tệp trong thư mục con.txt", "Another file.pdf"})
+
+# (original filename, expected normalized filename) under default rules
+_COMPREHENSIVE_VN_CASES: tuple[tuple[str, str], ...] = (
+    ("Nghị quyết số 123 về việc tăng lương.pdf",
+     "nghi quyet so 123 ve viec tang luong.pdf"),
+    ("Báo cáo đánh giá hiệu suất làm việc (Quý 1-2024).xlsx",
+     "bao cao danh gia hieu suat lam viec quy 1-2024.xlsx"),
+    ("Hướng dẫn thực hiện quy trình mới - Cực kỳ quan trọng!.docx",
+     "huong dan thuc hien quy trinh moi cuc ky quan trong.docx"),
+    ("Danh sách ứng viên tiềm năng & Kế hoạch tuyển dụng.txt",
+     "danh sach ung vien tiem nang and ke hoach tuyen dung.txt"),
+    ("Tổng hợp ý kiến đóng góp từ khách hàng.doc",
+     "tong hop y kien dong gop tu khach hang.doc"),
+)
+
+
+def _bulk_create(root: str, mapping: dict[str, bytes]) -> None:
+    """Create files under root from a {name: content} mapping"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    if os.open not in os.supports_dir_fd:
+        for name, data in mapping.items():
+            fd = os.open(os.path.join(root, name), flags, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        return
     
+    # Resolve root once and openat() each file relative to it
+    dir_fd = os.open(root, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    try:
+        for name, data in mapping.items():
+            fd = os.open(name, flags, 0o644, dir_fd=dir_fd)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _set_readonly(path: str) -> None:
+    """Mark a file read-only using the platform's native attribute"""
+    if sys.platform == "win32":
+        if not ctypes.windll.kernel32.SetFileAttributesW(path, stat.FILE_ATTRIBUTE_READONLY):
+            raise ctypes.WinError()
+    else:
+        os.chmod(path, 0o444)
+
+
+def _clear_readonly(path: str) -> None:
+    """Undo _set_readonly"""
+    if sys.platform == "win32":
+        if not ctypes.windll.kernel32.SetFileAttributesW(path, stat.FILE_ATTRIBUTE_NORMAL):
+            raise ctypes.WinError()
+    else:
+        os.chmod(path, 0o644)
+
+
+def _dir_names(path) -> set[str]:
+    """Names of the entries directly inside path"""
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries}
+
+
+# Tests reading the session-scoped corpus run on one xdist worker so the
+# corpus is only built once; under --dist loadgroup the rest spread freely.
+shared_corpus = pytest.mark.xdist_group("file_ops_integration")
+
+
+@pytest.fixture(scope="module")
+def _shared_file_engine():
+    """FileOperationsEngine with Vietnamese normalizer, built once per module"""
+    return FileOperationsEngine(VietnameseNormalizer())
+
+
+@pytest.fixture(scope="module")
+def vietnamese_normalization_rules():
+    """Vietnamese-specific normalization rules"""
+    return _VN_RULES
+
+
+@pytest.fixture(scope="module")
+def scanned_corpus(_shared_file_engine, readonly_vietnamese_corpus, vietnamese_normalization_rules):
+    """Files at the top of the read-only corpus and their previews, computed once"""
+    file_only = _shared_file_engine.scan_folder_contents(
+        readonly_vietnamese_corpus, recursive=False, file_types={FileType.FILE}
+    )
+    previews = _shared_file_engine.preview_rename(file_only, vietnamese_normalization_rules)
+    return SimpleNamespace(file_only=file_only, previews=previews)
+
+
+class TestFileOperationsIntegration:
     @pytest.fixture
-    def vietnamese_normalization_rules(self):
-        """Create Vietnamese-specific normalization rules"""
-        return NormalizationRules(
-            remove_diacritics=True,
-            lowercase_conversion=True,
-            clean_special_chars=True,
-            normalize_whitespace=True,
-            preserve_extensions=True
-        )
+    def file_engine(self, _shared_file_engine):
+        """Shared engine with its operation history cleared after each test"""
+        yield _shared_file_engine
+        _shared_file_engine.clear_history()
     
-    def test_scan_folder_contents_single_level(self, file_engine, temp_folder_with_vietnamese_files):
+    @shared_corpus
+    def test_scan_folder_contents_single_level(self, file_engine, readonly_vietnamese_corpus):
         """Test folder scanning at single level"""
-        files = file_engine.scan_folder_contents(temp_folder_with_vietnamese_files, recursive=False)
+        files = file_engine.scan_folder_contents(readonly_vietnamese_corpus, recursive=False)
         
         assert len(files) > 0
         
@@ -92,39 +152,43 @@ class TestFileOperationsIntegration:
         
         # Check specific Vietnamese files
         file_names = {f.name for f in files}
-        assert "Tài liệu quan trọng.txt" in file_names
-        assert "Báo cáo tài chính Q4.xlsx" in file_names
-        assert "Thư mục con" in file_names
+        assert _EXPECTED_TOP_LEVEL <= file_names
         
         # Verify file metadata is populated
-        for file_info in files:
-            assert file_info.path
-            assert file_info.original_name
-            if file_info.file_type == FileType.FILE:
-                assert file_info.size >= 0
-                assert file_info.size_formatted
+        assert all(f.path and f.original_name for f in files)
+        assert all(f.size >= 0 and f.size_formatted for f in files if f.file_type == FileType.FILE)
     
-    def test_scan_folder_contents_recursive(self, file_engine, temp_folder_with_vietnamese_files):
+    @shared_corpus
+    def test_scan_folder_contents_recursive(self, file_engine, readonly_vietnamese_corpus):
         """Test recursive folder scanning"""
-        files = file_engine.scan_folder_contents(temp_folder_with_vietnamese_files, recursive=True)
+        single_level_count = len(file_engine.scan_folder_contents(readonly_vietnamese_corpus, recursive=False))
+        files = file_engine.scan_folder_contents(readonly_vietnamese_corpus, recursive=True)
         
         # Should include files from subdirectory
         file_names = {f.name for f in files}
-        assert "Tệp trong thư mục con.txt" in file_names
-        assert "Another file.pdf" in file_names
+        assert _EXPECTED_RECURSIVE_ADDITIONS <= file_names
         
         # Should have more files than single-level scan
-        single_level_count = len(file_engine.scan_folder_contents(temp_folder_with_vietnamese_files, recursive=False))
         assert len(files) > single_level_count
     
-    def test_preview_rename_vietnamese_files(self, file_engine, temp_folder_with_vietnamese_files, vietnamese_normalization_rules):
-        """Test rename preview generation for Vietnamese files"""
-        files = file_engine.scan_folder_contents(temp_folder_with_vietnamese_files, recursive=False)
-        file_only = [f for f in files if f.file_type == FileType.FILE]
+    @shared_corpus
+    def test_scan_folder_contents_file_types(self, file_engine, readonly_vietnamese_corpus):
+        """Test restricting a scan to files or folders"""
+        folders = file_engine.scan_folder_contents(readonly_vietnamese_corpus, file_types={FileType.FOLDER})
+        assert [f.name for f in folders] == ["Thư mục con"]
         
-        previews = file_engine.preview_rename(file_only, vietnamese_normalization_rules)
+        files = file_engine.scan_folder_contents(readonly_vietnamese_corpus, recursive=True,
+                                                 file_types={FileType.FILE})
+        assert files
+        assert all(f.file_type == FileType.FILE for f in files)
+        assert _EXPECTED_RECURSIVE_ADDITIONS <= {f.name for f in files}
+    
+    @shared_corpus
+    def test_preview_rename_vietnamese_files(self, scanned_corpus):
+        """Test rename preview generation for Vietnamese files"""
+        previews = scanned_corpus.previews
         
-        assert len(previews) == len(file_only)
+        assert len(previews) == len(scanned_corpus.file_only)
         
         # Check specific transformations
         preview_map = {p.original_name: p for p in previews}
@@ -148,12 +212,10 @@ class TestFileOperationsIntegration:
             preview = preview_map["DOCUMENT   WITH   SPACES.doc"]
             assert "document with spaces.doc" == preview.normalized_name
     
-    def test_preview_no_changes_needed(self, file_engine, temp_folder_with_vietnamese_files, vietnamese_normalization_rules):
+    @shared_corpus
+    def test_preview_no_changes_needed(self, scanned_corpus):
         """Test preview for files that don't need changes"""
-        files = file_engine.scan_folder_contents(temp_folder_with_vietnamese_files, recursive=False)
-        file_only = [f for f in files if f.file_type == FileType.FILE]
-        
-        previews = file_engine.preview_rename(file_only, vietnamese_normalization_rules)
+        previews = scanned_corpus.previews
         
         # Find file that shouldn't change
         no_change_previews = [p for p in previews if not p.has_changes]
@@ -164,89 +226,87 @@ class TestFileOperationsIntegration:
             assert not english_file_preview.has_changes
             assert english_file_preview.normalized_name == english_file_preview.original_name
     
-    def test_dry_run_batch_rename(self, file_engine, temp_folder_with_vietnamese_files, vietnamese_normalization_rules):
-        """Test dry run batch rename operation"""
-        files = file_engine.scan_folder_contents(temp_folder_with_vietnamese_files, recursive=False)
-        file_only = [f for f in files if f.file_type == FileType.FILE][:3]  # Limit for test
+    @pytest.mark.parametrize("dry_run", [True, pytest.param(False, marks=pytest.mark.slow)], ids=["dry", "wet"])
+    def test_batch_rename(self, file_engine, vietnamese_normalization_rules, tmp_path, dry_run):
+        """Test dry run and actual batch rename execution"""
+        temp_dir = str(tmp_path)
+        renames = {
+            "Tệp thử nghiệm.txt": "tep thu nghiem.txt",
+            "File@special#chars.pdf": "file at special hash chars.pdf",
+        }
+        _bulk_create(temp_dir, dict.fromkeys(renames, _DUMMY))
         
+        # Scan and preview
+        file_only = file_engine.scan_folder_contents(temp_dir, recursive=False, file_types={FileType.FILE})
         previews = file_engine.preview_rename(file_only, vietnamese_normalization_rules)
         
-        # Create batch operation for dry run
         batch_op = BatchOperation(
             operation_type=OperationType.BATCH_RENAME,
             normalization_rules=vietnamese_normalization_rules,
             total_files=len(previews),
-            dry_run=True
+            dry_run=dry_run
         )
         
-        # Execute dry run
         result = file_engine.execute_batch_rename(previews, batch_op)
         
         assert result.is_completed()
-        assert result.dry_run is True
+        assert result.dry_run is dry_run
         assert result.total_files == len(previews)
-        assert result.processed_files == len(previews)
         
-        # Files should not actually be renamed in dry run
-        original_files = os.listdir(temp_folder_with_vietnamese_files)
-        assert "Tài liệu quan trọng.txt" in original_files  # Original should still exist
-        assert "tai lieu quan trong.txt" not in original_files  # New name should not exist
-    
-    def test_actual_batch_rename_operation(self, file_engine, vietnamese_normalization_rules):
-        """Test actual file rename execution"""
-        # Create separate temp directory for this destructive test
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test files
-            test_files = [
-                "Tệp thử nghiệm.txt",
-                "File@special#chars.pdf"
-            ]
-            
-            for filename in test_files:
-                file_path = os.path.join(temp_dir, filename)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"Content for {filename}")
-            
-            # Scan and preview
-            files = file_engine.scan_folder_contents(temp_dir, recursive=False)
-            file_only = [f for f in files if f.file_type == FileType.FILE]
-            previews = file_engine.preview_rename(file_only, vietnamese_normalization_rules)
-            
-            # Execute actual rename (not dry run)
-            batch_op = BatchOperation(
-                operation_type=OperationType.BATCH_RENAME,
-                normalization_rules=vietnamese_normalization_rules,
-                total_files=len(previews),
-                dry_run=False
-            )
-            
-            result = file_engine.execute_batch_rename(previews, batch_op)
-            
-            assert result.is_completed()
+        names = _dir_names(temp_dir)
+        if dry_run:
+            # Files should not actually be renamed in dry run
+            assert result.processed_files == len(previews)
+            assert names == set(renames)
+        else:
+            # Files should be renamed and originals gone
             assert result.successful_operations > 0
-            
-            # Check that files were actually renamed
-            renamed_files = os.listdir(temp_dir)
-            assert "tep thu nghiem.txt" in renamed_files
-            assert "file at special hash chars.pdf" in renamed_files
-            
-            # Original files should not exist
-            assert "Tệp thử nghiệm.txt" not in renamed_files
-            assert "File@special#chars.pdf" not in renamed_files
+            assert names == set(renames.values())
     
-    def test_backup_creation_during_rename(self, file_engine):
+    @pytest.mark.slow
+    def test_backup_creation_during_rename(self, file_engine, tmp_path):
         """Test backup creation during rename operations"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test file
-            original_file = os.path.join(temp_dir, "Tệp gốc.txt")
-            with open(original_file, 'w', encoding='utf-8') as f:
-                f.write("Original content")
-            
-            # Rules with backup enabled
-            rules = NormalizationRules(create_backup=True)
+        temp_dir = str(tmp_path)
+        # Create test file
+        _bulk_create(temp_dir, {"Tệp gốc.txt": _DUMMY})
+        
+        # Rules with backup enabled
+        rules = NormalizationRules(create_backup=True)
+        
+        file_only = file_engine.scan_folder_contents(temp_dir, file_types={FileType.FILE})
+        previews = file_engine.preview_rename(file_only, rules)
+        
+        batch_op = BatchOperation(
+            operation_type=OperationType.BATCH_RENAME,
+            normalization_rules=rules,
+            total_files=len(previews),
+            dry_run=False
+        )
+        
+        result = file_engine.execute_batch_rename(previews, batch_op)
+        
+        # Check operation completed successfully
+        assert result.successful_operations > 0
+        
+        # Renamed file should exist
+        renamed_files = _dir_names(temp_dir)
+        assert "tep goc.txt" in renamed_files
+    
+    @pytest.mark.slow
+    def test_readonly_file_handling(self, file_engine, tmp_path):
+        """Test handling of read-only files"""
+        temp_dir = str(tmp_path)
+        # Create test file and make it read-only
+        readonly_file = os.path.join(temp_dir, "Tệp chỉ đọc.txt")
+        _bulk_create(temp_dir, {"Tệp chỉ đọc.txt": _DUMMY})
+        
+        _set_readonly(readonly_file)
+        
+        try:
+            # Rules to skip read-only files
+            rules = NormalizationRules(skip_readonly_files=True)
             
-            files = file_engine.scan_folder_contents(temp_dir)
-            file_only = [f for f in files if f.file_type == FileType.FILE]
+            file_only = file_engine.scan_folder_contents(temp_dir, file_types={FileType.FILE})
             previews = file_engine.preview_rename(file_only, rules)
             
             batch_op = BatchOperation(
@@ -258,82 +318,45 @@ class TestFileOperationsIntegration:
             
             result = file_engine.execute_batch_rename(previews, batch_op)
             
-            # Check operation completed successfully
-            assert result.successful_operations > 0
-            
-            # Renamed file should exist
-            renamed_files = os.listdir(temp_dir)
-            assert "tep goc.txt" in renamed_files
-    
-    def test_readonly_file_handling(self, file_engine):
-        """Test handling of read-only files"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test file and make it read-only
-            readonly_file = os.path.join(temp_dir, "Tệp chỉ đọc.txt")
-            with open(readonly_file, 'w', encoding='utf-8') as f:
-                f.write("Read-only content")
+            # Should skip the read-only file
+            assert result.skipped_operations > 0
             
-            # Make file read-only (Windows and Unix compatible)
-            os.chmod(readonly_file, 0o444)
+            # Original file should still exist
+            remaining_files = _dir_names(temp_dir)
+            assert "Tệp chỉ đọc.txt" in remaining_files
             
-            try:
-                # Rules to skip read-only files
-                rules = NormalizationRules(skip_readonly_files=True)
-                
-                files = file_engine.scan_folder_contents(temp_dir)
-                file_only = [f for f in files if f.file_type == FileType.FILE]
-                previews = file_engine.preview_rename(file_only, rules)
-                
-                batch_op = BatchOperation(
-                    operation_type=OperationType.BATCH_RENAME,
-                    normalization_rules=rules,
-                    total_files=len(previews),
-                    dry_run=False
-                )
-                
-                result = file_engine.execute_batch_rename(previews, batch_op)
-                
-                # Should skip the read-only file
-                assert result.skipped_operations > 0
-                
-                # Original file should still exist
-                remaining_files = os.listdir(temp_dir)
-                assert "Tệp chỉ đọc.txt" in remaining_files
-                
-            finally:
-                # Restore write permissions for cleanup
-                os.chmod(readonly_file, 0o666)
+        finally:
+            # Windows refuses to delete read-only files during tmp_path cleanup;
+            # on POSIX the writable parent directory is enough
+            if sys.platform == "win32":
+                _clear_readonly(readonly_file)
     
-    def test_file_conflict_detection(self, file_engine):
+    def test_file_conflict_detection(self, file_engine, tmp_path):
         """Test detection of file naming conflicts"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create two files that would normalize to same name
-            file1 = os.path.join(temp_dir, "Tệp Một.txt")
-            file2 = os.path.join(temp_dir, "tệp một.txt")  # Different case, same normalized result
-            
-            with open(file1, 'w', encoding='utf-8') as f:
-                f.write("Content 1")
-            with open(file2, 'w', encoding='utf-8') as f:
-                f.write("Content 2")
-            
-            files = file_engine.scan_folder_contents(temp_dir)
-            file_only = [f for f in files if f.file_type == FileType.FILE]
-            previews = file_engine.preview_rename(file_only, NormalizationRules())
-            
-            # Both files would normalize to "tep mot.txt"
-            normalized_names = [p.normalized_name for p in previews]
-            
-            # Should detect potential conflict
-            conflict_previews = [p for p in previews if p.warnings]
-            assert len(conflict_previews) > 0 or len(set(normalized_names)) < len(normalized_names)
+        temp_dir = str(tmp_path)
+        # Create two files that would normalize to same name
+        _bulk_create(temp_dir, {
+            "Tệp Một.txt": _DUMMY,
+            "tệp một.txt": _DUMMY,  # Different case, same normalized result
+        })
+        
+        file_only = file_engine.scan_folder_contents(temp_dir, file_types={FileType.FILE})
+        previews = file_engine.preview_rename(file_only, _DEFAULT_RULES)
+        
+        # Both files would normalize to "tep mot.txt"
+        normalized_names = [p.normalized_name for p in previews]
+        
+        # Should detect potential conflict
+        conflict_previews = [p for p in previews if p.warnings]
+        assert len(conflict_previews) > 0 or len(set(normalized_names)) < len(normalized_names)
     
-    def test_operation_validation(self, file_engine, temp_folder_with_vietnamese_files):
+    @shared_corpus
+    def test_operation_validation(self, file_engine, scanned_corpus):
         """Test operation validation before execution"""
-        files = file_engine.scan_folder_contents(temp_folder_with_vietnamese_files, recursive=False)
-        file_only = [f for f in files if f.file_type == FileType.FILE]
+        file_only = scanned_corpus.file_only
         
         # Valid rules
-        valid_rules = NormalizationRules()
+        valid_rules = _DEFAULT_RULES
         validation = file_engine.validate_operation(file_only, valid_rules)
         
         assert validation['valid'] is True
@@ -347,19 +370,19 @@ class TestFileOperationsIntegration:
         assert validation['valid'] is False
         assert len(validation['errors']) > 0
     
-    def test_operation_history_tracking(self, file_engine, temp_folder_with_vietnamese_files):
+    @shared_corpus
+    def test_operation_history_tracking(self, file_engine, readonly_vietnamese_corpus):
         """Test operation history tracking"""
-        files = file_engine.scan_folder_contents(temp_folder_with_vietnamese_files, recursive=False)
-        file_only = [f for f in files if f.file_type == FileType.FILE][:2]  # Limit for test
+        file_only = file_engine.scan_folder_contents(readonly_vietnamese_corpus, recursive=False, file_types={FileType.FILE})[:2]  # Limit for test
         
         # Initially no history
         assert len(file_engine.get_operation_history()) == 0
         
         # Execute dry run operation
-        previews = file_engine.preview_rename(file_only, NormalizationRules())
+        previews = file_engine.preview_rename(file_only, _DEFAULT_RULES)
         batch_op = BatchOperation(
             operation_type=OperationType.BATCH_RENAME,
-            normalization_rules=NormalizationRules(),
+            normalization_rules=_DEFAULT_RULES,
             total_files=len(previews),
             dry_run=True
         )
@@ -371,52 +394,32 @@ class TestFileOperationsIntegration:
         assert len(history) == 1
         assert history[0].operation_id == result.operation_id
         assert history[0].is_completed()
+        
+        file_engine.clear_history()
+        assert file_engine.get_operation_history() == []
     
-    def test_error_handling_invalid_folder(self, file_engine):
+    def test_error_handling_invalid_folder(self, file_engine, tmp_path):
         """Test error handling for invalid folder paths"""
         # Non-existent folder
         with pytest.raises(ValueError):
             file_engine.scan_folder_contents("/nonexistent/folder/path")
         
         # File instead of folder
-        with tempfile.NamedTemporaryFile() as temp_file:
-            with pytest.raises(ValueError):
-                file_engine.scan_folder_contents(temp_file.name)
+        temp_file = tmp_path / "not_a_folder.txt"
+        temp_file.touch()
+        with pytest.raises(ValueError):
+            file_engine.scan_folder_contents(str(temp_file))
     
-    def test_comprehensive_vietnamese_character_processing(self, file_engine):
+    @pytest.mark.slow
+    def test_comprehensive_vietnamese_character_processing(self, file_engine, tmp_path):
         """Test comprehensive Vietnamese character processing in realistic scenarios"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create files with comprehensive Vietnamese text
-            vietnamese_files = [
-                "Nghị quyết số 123 về việc tăng lương.pdf",
-                "Báo cáo đánh giá hiệu suất làm việc (Quý 1-2024).xlsx",
-                "Hướng dẫn thực hiện quy trình mới - Cực kỳ quan trọng!.docx",
-                "Danh sách ứng viên tiềm năng & Kế hoạch tuyển dụng.txt",
-                "Tổng hợp ý kiến đóng góp từ khách hàng.doc",
-            ]
-            
-            expected_normalized = [
-                "nghi quyet so 123 ve viec tang luong.pdf",
-                "bao cao danh gia hieu suat lam viec quy 1-2024.xlsx", 
-                "huong dan thuc hien quy trinh moi cuc ky quan trong.docx",
-                "danh sach ung vien tiem nang and ke hoach tuyen dung.txt",
-                "tong hop y kien dong gop tu khach hang.doc",
-            ]
-            
-            # Create files
-            for filename in vietnamese_files:
-                file_path = os.path.join(temp_dir, filename)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"Vietnamese content for {filename}")
-            
-            # Process files
-            files = file_engine.scan_folder_contents(temp_dir)
-            file_only = [f for f in files if f.file_type == FileType.FILE]
-            previews = file_engine.preview_rename(file_only, NormalizationRules())
-            
-            # Verify transformations
-            preview_map = {p.original_name: p.normalized_name for p in previews}
-            
-            for original, expected in zip(vietnamese_files, expected_normalized):
-                if original in preview_map:
-                    assert preview_map[original] == expected, f"Failed for {original}: got {preview_map[original]}, expected {expected}"
\ No newline at end of file
+        temp_dir = str(tmp_path)
+        _bulk_create(temp_dir, {filename: _DUMMY for filename, _ in _COMPREHENSIVE_VN_CASES})
+        
+        # Process files
+        file_only = file_engine.scan_folder_contents(temp_dir, file_types={FileType.FILE})
+        previews = file_engine.preview_rename(file_only, _DEFAULT_RULES)
+        
+        # Verify transformations
+        preview_map = {p.original_name: p.normalized_name for p in previews}
+        assert preview_map == dict(_COMPREHENSIVE_VN_CASES)
\ No newline at end of file
@@ -9,13 +9,28 @@ import tempfile
 import os
 import time
 import shutil
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 
 from src.core.services.normalize_service import VietnameseNormalizer, NormalizationRules
 from src.core.models.file_info import FileInfo, FileType
 from src.core.services.batch_operation_service import BatchOperationService
 from src.core.utils.memory_manager import get_memory_manager, MemoryStats
 
+NORMALIZE_WORKERS = min(7, os.cpu_count() or 1)
+
+# O_BINARY only exists (and matters) on Windows
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+# Test file name patterns: plain ASCII, Vietnamese, spaces, Vietnamese again (i % 15 == 0)
+_NAME_TEMPLATES = (
+    "test_file_{}.txt",
+    "Tệp_Tiếng_Việt_{}.txt",
+    "File With Spaces {}.txt",
+    "Tệp_Tiếng_Việt_{}.txt",
+)
+
 
 class TestBasicPerformance:
     """Basic performance validation tests"""
@@ -28,25 +43,30 @@ class TestBasicPerformance:
         
     def teardown_method(self):
         """Cleanup test environment"""
-        if os.path.exists(self.temp_dir):
+        # The directory is flat: unlink entries from one scandir pass instead of rmtree's walk
+        try:
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    os.unlink(entry.path)
+            os.rmdir(self.temp_dir)
+        except OSError:
             shutil.rmtree(self.temp_dir, ignore_errors=True)
     
-    def create_test_files(self, count: int) -> List[str]:
-        """Create test files for performance testing"""
-        files = []
-        for i in range(count):
-            filename = f"test_file_{i}.txt"
-            if i % 5 == 0:
-                filename = f"Tệp_Tiếng_Việt_{i}.txt"
-            elif i % 3 == 0:
-                filename = f"File With Spaces {i}.txt"
-            
-            filepath = os.path.join(self.temp_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"Test content for file {i}")
-            files.append(filepath)
+    def create_test_files(self, count: int) -> Tuple[List[str], List[str]]:
+        """Create test files for performance testing, returning (paths, names)"""
+        # Index bit 0: i % 5 == 0 (Vietnamese wins), bit 1: i % 3 == 0 (spaces)
+        names = [_NAME_TEMPLATES[(i % 5 == 0) | (i % 3 == 0) << 1].format(i) for i in range(count)]
+        files = [os.path.join(self.temp_dir, name) for name in names]
+        
+        for i, filepath in enumerate(files):
+            # Raw fd write: no TextIOWrapper/BufferedWriter built per file
+            fd = os.open(filepath, _CREATE_FLAGS, 0o644)
+            try:
+                os.write(fd, b"Test content for file %d" % i)
+            finally:
+                os.close(fd)
         
-        return files
+        return files, names
     
     def test_normalization_performance(self):
         """Test normalization performance with various file counts"""
@@ -56,40 +76,37 @@ class TestBasicPerformance:
             ("Large batch", 1000)
         ]
         
+        # Report and assertions wait until all batches ran, so no print I/O lands near a timer
+        report = []
+        results = []
         for test_name, file_count in test_cases:
-            print(f"\n--- {test_name}: {file_count} files ---")
-            
             # Create test files
-            files = self.create_test_files(file_count)
+            files, names = self.create_test_files(file_count)
             
-            # Measure normalization performance
-            start_time = time.time()
+            # Measure normalization performance; memory sampling stays outside the timed window
             start_memory = MemoryStats.get_current()
+            start_time = time.perf_counter()
             
-            normalized_count = 0
-            for filepath in files:
-                filename = os.path.basename(filepath)
-                normalized_name = self.normalizer.normalize_filename(filename)
-                if normalized_name != filename:
-                    normalized_count += 1
+            # Names are independent; chunksize amortizes the executor queue overhead
+            with ThreadPoolExecutor(max_workers=NORMALIZE_WORKERS) as pool:
+                normalized = list(pool.map(self.normalizer.normalize_filename, names, chunksize=64))
+            normalized_count = sum(map(str.__ne__, normalized, names))
             
-            end_time = time.time()
+            duration = time.perf_counter() - start_time
             end_memory = MemoryStats.get_current()
             
             # Calculate metrics
-            duration = end_time - start_time
             files_per_second = file_count / duration if duration > 0 else float('inf')
             memory_used = end_memory.process_memory_mb - start_memory.process_memory_mb
             
-            print(f"Duration: {duration:.3f}s")
-            print(f"Files/sec: {files_per_second:.1f}")
-            print(f"Memory used: {memory_used:.2f}MB")
-            print(f"Files normalized: {normalized_count}")
-            
-            # Performance assertions (relaxed for basic validation)
-            assert duration < 5.0, f"Normalization too slow: {duration:.3f}s for {file_count} files"
-            assert files_per_second > 50, f"Processing rate too low: {files_per_second:.1f} files/sec"
-            assert memory_used < 50, f"Memory usage too high: {memory_used:.2f}MB"
+            results.append((file_count, duration, files_per_second, memory_used))
+            report.append(
+                f"\n--- {test_name}: {file_count} files ---\n"
+                f"Duration: {duration:.3f}s\n"
+                f"Files/sec: {files_per_second:.1f}\n"
+                f"Memory used: {memory_used:.2f}MB\n"
+                f"Files normalized: {normalized_count}"
+            )
             
             # Clean up files
             for filepath in files:
@@ -97,6 +114,14 @@ class TestBasicPerformance:
                     os.remove(filepath)
                 except:
                     pass
+        
+        print("\n".join(report))
+        
+        for file_count, duration, files_per_second, memory_used in results:
+            # Performance assertions (relaxed for basic validation)
+            assert duration < 5.0, f"Normalization too slow: {duration:.3f}s for {file_count} files"
+            assert files_per_second > 50, f"Processing rate too low: {files_per_second:.1f} files/sec"
+            assert memory_used < 50, f"Memory usage too high: {memory_used:.2f}MB"
     
     def test_memory_stability(self):
         """Test memory stability during repeated operations"""
@@ -105,22 +130,15 @@ class TestBasicPerformance:
         initial_memory = MemoryStats.get_current()
         print(f"Initial memory: {initial_memory.process_memory_mb:.2f}MB")
         
+        # Same 200 files every round, so only the normalizer's memory is measured
+        _, names = self.create_test_files(200)
+        
         # Perform repeated operations
         for round_num in range(5):
-            files = self.create_test_files(200)
-            
             # Normalize all files
-            for filepath in files:
-                filename = os.path.basename(filepath)
+            for filename in names:
                 self.normalizer.normalize_filename(filename)
             
-            # Clean up
-            for filepath in files:
-                try:
-                    os.remove(filepath)
-                except:
-                    pass
-            
             # Force garbage collection
             self.memory_manager.trigger_gc(force=True)
             
@@ -140,23 +158,26 @@ class TestBasicPerformance:
         """Test FileInfo object creation performance"""
         print("\n--- FileInfo Creation Performance ---")
         
-        files = self.create_test_files(500)
+        files, _ = self.create_test_files(500)
         
-        start_time = time.time()
         start_memory = MemoryStats.get_current()
+        start_time = time.perf_counter()
+        
+        # One scandir pass supplies every stat result; from_path then makes no stat calls
+        with os.scandir(self.temp_dir) as entries:
+            stat_cache = {entry.path: entry.stat() for entry in entries}
         
         file_infos = []
         for filepath in files:
             try:
-                file_info = FileInfo.from_path(filepath)
+                file_info = FileInfo.from_path(filepath, stat_cache=stat_cache)
                 file_infos.append(file_info)
             except Exception as e:
                 print(f"Error creating FileInfo for {filepath}: {e}")
         
-        end_time = time.time()
+        duration = time.perf_counter() - start_time
         end_memory = MemoryStats.get_current()
         
-        duration = end_time - start_time
         objects_per_second = len(file_infos) / duration if duration > 0 else float('inf')
         memory_used = end_memory.process_memory_mb - start_memory.process_memory_mb
         
@@ -176,19 +197,15 @@ class TestBasicPerformance:
         print(f"\n--- Directory Scanning: {file_count} files ---")
         
         # Create test files
-        files = self.create_test_files(file_count)
+        files, _ = self.create_test_files(file_count)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        # Scan directory
-        scanned_files = []
-        for item in os.listdir(self.temp_dir):
-            item_path = os.path.join(self.temp_dir, item)
-            if os.path.isfile(item_path):
-                scanned_files.append(item_path)
+        # Scan directory - DirEntry.is_file() uses the cached d_type, no stat per file
+        with os.scandir(self.temp_dir) as entries:
+            scanned_files = [entry.path for entry in entries if entry.is_file()]
         
-        end_time = time.time()
-        duration = end_time - start_time
+        duration = time.perf_counter() - start_time
         scan_rate = len(scanned_files) / duration if duration > 0 else float('inf')
         
         print(f"Scanned {len(scanned_files)} files in {duration:.4f}s")
@@ -205,19 +222,15 @@ def test_performance_baseline():
     print("\n--- Performance Baseline Test ---")
     
     # Simple operations
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # String operations
-    test_strings = [f"Test_{i}_Tệp_Tiếng_Việt" for i in range(1000)]
-    normalized_strings = []
+    test_strings = tuple(f"Test_{i}_Tệp_Tiếng_Việt" for i in range(1000))
     
     normalizer = VietnameseNormalizer()
-    for s in test_strings:
-        normalized = normalizer.normalize_text(s)
-        normalized_strings.append(normalized)
+    normalized_strings = list(map(normalizer.normalize_text, test_strings))
     
-    end_time = time.time()
-    duration = end_time - start_time
+    duration = time.perf_counter() - start_time
     
     print(f"Processed {len(test_strings)} strings in {duration:.3f}s")
     print(f"String processing rate: {len(test_strings) / duration:.1f} strings/sec")
@@ -57,8 +57,12 @@ class PerformanceTestHelper:
                 filename = f"file@special#chars{i:06d}.txt"
             
             filepath = os.path.join(test_dir, filename)
-            with open(filepath, 'w') as f:
-                f.write(f"Test content for file {i}\n" * (i % 10 + 1))
+            # Raw fd write: no text-mode file object per file
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, b"Test content for file %d\n" % i * (i % 10 + 1))
+            finally:
+                os.close(fd)
         
         logger.info(f"Created test directory with {file_count} files at {test_dir}")
         return test_dir
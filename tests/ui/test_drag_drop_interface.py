@@ -296,10 +296,15 @@ class TestCrossPlatformUICompatibility:
         
         validator = get_drag_drop_validator()
         
+        entry = MagicMock()
+        entry.name = 'file1.txt'
+        entry.is_dir.return_value = False
+        
         with patch('os.path.exists', return_value=True):
             with patch('os.path.isdir', return_value=True):
                 with patch('os.access', return_value=True):
-                    with patch('os.listdir', return_value=['file1.txt']):
+                    with patch('os.scandir') as mock_scandir:
+                        mock_scandir.return_value.__enter__.return_value = [entry]
                         
                         result = validator.validate_dropped_folder(unc_path)
                         
@@ -1,12 +1,7 @@
 import pytest
 import tkinter as tk
-import sys
-import os
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
-from ui.main_window import MainWindow, StateManager, ApplicationState, AppState
+from src.ui.main_window import MainWindow, StateManager, ApplicationState, AppState
 
 
 class TestMainWindow:
@@ -97,6 +92,36 @@ class TestStateManager:
         assert observers_called["obs1"] == 1
         assert observers_called["obs2"] == 1
 
+    def test_reset(self, state_manager):
+        observer_called = []
+        state_manager.subscribe(observer_called.append)
+        state_manager.update_state(selected_folder="/test/path")
+
+        state_manager.reset()
+        state_manager.update_state(current_state=AppState.LOADING)
+
+        assert state_manager.state.selected_folder is None
+        assert len(observer_called) == 1
+
+    def test_update_without_notify(self, state_manager):
+        observer_called = []
+        state_manager.subscribe(observer_called.append)
+        state_manager.update_state(selected_folder="/test", progress_percentage=50.0, notify=False)
+
+        assert state_manager.state.selected_folder == "/test"
+        assert state_manager.state.progress_percentage == 50.0
+        assert observer_called == []
+
+    def test_silent_updates_reach_next_notification(self, state_manager):
+        observer_called = []
+        state_manager.subscribe(observer_called.append)
+        state_manager.update_state(selected_folder="/test", notify=False)
+        state_manager.update_state(current_state=AppState.LOADING)
+
+        assert len(observer_called) == 1
+        assert observer_called[0].selected_folder == "/test"
+        assert observer_called[0].current_state == AppState.LOADING
+
 
 class TestApplicationState:
     def test_default_initialization(self):
@@ -13,11 +13,16 @@ Tests comprehensive Vietnamese text processing including:
 import pytest
 import sys
 import os
+import unicodedata
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from core.services.normalize_service import VietnameseNormalizer, NormalizationRules
+from core.models.config import NormalizationRulesConfig
+from core.models import operation
+from core.models.file_info import FileInfo, FileType
+from core.services.file_operations_engine import FileOperationsEngine
 
 
 class TestVietnameseNormalizer:
@@ -138,6 +143,11 @@ class TestVietnameseNormalizer:
             result = normalizer.clean_special_chars(input_text)
             assert result == expected, f"Failed for '{input_text}': got '{result}', expected '{expected}'"
     
+    def test_clean_special_chars_chained_replacements(self, normalizer):
+        """Test maps whose outputs feed later keys keep sequential replace semantics"""
+        assert normalizer.clean_special_chars("a!b", {'!': '#', '#': ' hash '}) == "a hash b"
+        assert normalizer.clean_special_chars("a!b", {'!': '', '_': ' '}) == "ab"
+    
     def test_normalize_whitespace(self, normalizer):
         """Test whitespace normalization"""
         test_cases = [
@@ -276,6 +286,78 @@ class TestVietnameseNormalizer:
         result = normalizer.clean_special_chars("test@email#tag", rules_dict) 
         assert result == "test AT email HASH tag"
     
+    def test_custom_replacements_single_pass(self, normalizer):
+        """Test longer keys win and replacement output is not rescanned"""
+        replacements = {'a': 'b', 'b': 'c', 'ab': 'X'}
+        assert normalizer._apply_custom_replacements("ab a b", replacements) == "X b c"
+    
+    def test_ascii_text_skips_diacritic_pass(self, normalizer, default_rules, monkeypatch):
+        """Test ASCII input bypasses diacritic folding with identical output"""
+        calls = []
+        original = normalizer.remove_diacritics
+        monkeypatch.setattr(normalizer, 'remove_diacritics', lambda text: calls.append(text) or original(text))
+        
+        assert normalizer.normalize_text("File With Spaces 3", default_rules) == "file with spaces 3"
+        assert calls == []
+        
+        # Custom replacements can introduce diacritics, which still get folded
+        rules = NormalizationRules(custom_replacements={'x': 'ệ'})
+        assert normalizer.normalize_text("Tax", rules) == "tae"
+        assert calls == ["Taệ"]
+    
+    def test_remove_diacritics_decomposed_input(self, normalizer):
+        """Test NFD-decomposed text folds the same as precomposed text"""
+        for text in ["Tệp Tiếng Việt", "Nguyễn Văn Đức", "QUAN TRỌNG"]:
+            decomposed = unicodedata.normalize('NFD', text)
+            assert normalizer.remove_diacritics(decomposed) == normalizer.remove_diacritics(text)
+        
+        # Marks with no precomposed form are dropped by the same table
+        assert normalizer.remove_diacritics("x\u0301y\u0323") == "xy"
+    
+    def test_remove_diacritics_fallback_branches(self, normalizer):
+        """Test each pass of remove_diacritics: table, NFC retry and unidecode"""
+        # Vietnamese folds to ASCII in the table pass
+        assert normalizer.remove_diacritics("Tiếng Việt") == "Tieng Viet"
+        
+        # The Greek question mark composes to ';' and returns after the NFC retry
+        # (unidecode alone would give '?')
+        assert normalizer.remove_diacritics("a\u037eb") == "a;b"
+        
+        # Decomposed Cyrillic is composed before unidecode (which alone would give 'Elka')
+        decomposed = unicodedata.normalize('NFD', "Ёлка")
+        assert normalizer.remove_diacritics(decomposed) == normalizer.remove_diacritics("Ёлка") == "Iolka"
+        
+        # Already-NFC text outside the table goes straight to unidecode
+        assert normalizer.remove_diacritics("Müller") == "Muller"
+    
+    def test_normalize_filename_cache_tracks_rule_changes(self, normalizer):
+        """Test cached filenames are shared across instances but never stale"""
+        rules = NormalizationRules()
+        assert normalizer.normalize_filename("Tài Liệu.TXT", rules) == "tai lieu.TXT"
+        assert VietnameseNormalizer().normalize_filename("Tài Liệu.TXT", NormalizationRules()) == "tai lieu.TXT"
+        
+        # Mutating the rules changes the cache key
+        rules.preserve_case_for_extensions = False
+        rules.custom_replacements['Liệu'] = 'Lieu moi'
+        assert normalizer.normalize_filename("Tài Liệu.TXT", rules) == "tai lieu moi.txt"
+    
+    def test_normalize_filename_with_operation_rules(self, normalizer):
+        """Test operation.NormalizationRules (no cache_key()) works with the filename cache"""
+        rules = operation.NormalizationRules()
+        assert normalizer.normalize_filename("Tài Liệu.TXT", rules) == "tai lieu.TXT"
+        assert normalizer.normalize_filename("Báo cáo (FINAL)!.docx", rules) == \
+            normalizer._normalize_filename("Báo cáo (FINAL)!.docx", rules)
+    
+    def test_preview_rename_with_operation_rules(self, tmp_path):
+        """Test FileOperationsEngine previews, which pass operation.NormalizationRules"""
+        path = tmp_path / "Tài Liệu.TXT"
+        path.write_text("content", encoding="utf-8")
+        file_info = FileInfo(path.name, path.name, str(path), FileType.FILE)
+        
+        previews = FileOperationsEngine().preview_rename([file_info], operation.NormalizationRules())
+        
+        assert [preview.normalized_name for preview in previews] == ["tai lieu.TXT"]
+    
     def test_normalization_rules_validation(self):
         """Test normalization rules validation"""
         # Valid rules
@@ -376,4 +458,18 @@ class TestNormalizationRules:
         # Deserialize from dict
         restored_rules = NormalizationRules.from_dict(rules_dict)
         assert restored_rules.remove_diacritics is True
-        assert restored_rules.custom_replacements['@'] == '_at_'
\ No newline at end of file
+        assert restored_rules.custom_replacements['@'] == '_at_'
+    
+    def test_config_rules_conversion_cached(self):
+        """Test equal configs share converted rules and changes are picked up"""
+        normalizer = VietnameseNormalizer()
+        config_rules = NormalizationRulesConfig(custom_replacements={'@': '_at_'})
+        
+        first = normalizer._convert_config_to_rules(config_rules)
+        assert normalizer._convert_config_to_rules(NormalizationRulesConfig(custom_replacements={'@': '_at_'})) is first
+        
+        config_rules.remove_diacritics = False
+        updated = normalizer._convert_config_to_rules(config_rules)
+        assert updated is not first
+        assert updated.remove_diacritics is False
+        assert updated.custom_replacements == {'@': '_at_'}
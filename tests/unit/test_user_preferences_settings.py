@@ -111,6 +111,24 @@ class TestAppConfiguration:
             assert len(config.recent_folders) == 1
             assert config.recent_folders[0].path == existing_path
     
+    def test_clean_recent_folders_many(self, tmp_path):
+        """Test cleaning a list long enough to check existence in parallel"""
+        config = AppConfiguration()
+        config.ui_preferences.max_recent_folders = 20
+        
+        existing = []
+        for i in range(6):
+            folder = tmp_path / f"folder{i}"
+            folder.mkdir()
+            existing.append(str(folder))
+            config.add_recent_folder(str(folder))
+            config.add_recent_folder(f"/definitely/does/not/exist/{i}")
+        
+        removed_count = config.clean_recent_folders()
+        
+        assert removed_count == 6
+        assert config.get_recent_folders_list() == existing[::-1]  # Order preserved
+    
     def test_reset_to_defaults(self):
         """Test resetting configuration to defaults"""
         config = AppConfiguration()
@@ -254,7 +272,7 @@ class TestConfigRepository:
         self.db_path = self.temp_file.name
         self.temp_file.close()
         
-        self.db_service = DatabaseService(self.db_path)
+        self.db_service = DatabaseService(self.db_path, testing_mode=True)
         self.repository = ConfigRepository(self.db_service)
     
     def teardown_method(self):
@@ -379,7 +397,7 @@ class TestConfigService:
         self.db_path = self.temp_file.name
         self.temp_file.close()
         
-        self.service = ConfigService(db_path=self.db_path)
+        self.service = ConfigService(db_path=self.db_path, testing_mode=True)
     
     def teardown_method(self):
         """Cleanup test database"""
@@ -437,6 +455,33 @@ class TestConfigService:
             folders_after = self.service.get_recent_folders()
             assert len(folders_after) == 0
     
+    def test_getters_return_copies(self):
+        """Test mutating returned config does not touch the service until update"""
+        rules = self.service.get_normalization_rules()
+        rules.max_filename_length = -1
+        
+        assert self.service.get_normalization_rules().max_filename_length != -1
+        assert self.service.update_normalization_rules(rules) is False
+        assert self.service.validate_current_configuration()['is_valid'] is True
+    
+    def test_testing_mode_pragmas(self):
+        """Test testing_mode relaxes SQLite durability"""
+        with self.service.repository.db_service.get_connection() as conn:
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        assert synchronous == 1  # NORMAL
+    
+    def test_add_recent_folders_batch(self):
+        """Test adding several recent folders với one notification"""
+        notifications = []
+        self.service.add_change_listener(notifications.append)
+        
+        success = self.service.add_recent_folders_batch(["/batch/one", "/batch/two"])
+        assert success
+        assert len(notifications) == 1
+        
+        folders = self.service.get_recent_folders()
+        assert folders == [normalize_test_path("/batch/two"), normalize_test_path("/batch/one")]
+    
     def test_reset_to_defaults(self):
         """Test resetting service to defaults"""
         # Modify configuration
@@ -520,7 +565,7 @@ class TestUserPreferencesIntegration:
         self.temp_file.close()
         
         # Create service with clean database
-        self.service = ConfigService(db_path=self.db_path)
+        self.service = ConfigService(db_path=self.db_path, testing_mode=True)
     
     def teardown_method(self):
         """Cleanup integration test"""
@@ -587,7 +632,7 @@ class TestUserPreferencesIntegration:
         
         # Simulate service restart
         self.service.shutdown()
-        new_service = ConfigService(db_path=self.db_path)
+        new_service = ConfigService(db_path=self.db_path, testing_mode=True)
         
         # Verify settings persisted
         config = new_service.get_current_config()